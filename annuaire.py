@@ -0,0 +1,145 @@
+import bisect
+import re
+import unicodedata
+from collections import Counter
+
+import numpy as np
+import streamlit as st
+
+from classements import charger_lignes_tireurs
+from donnees import charger_index_tireurs
+
+# ===== ANNUAIRE DES TIREURS =====
+# Liste des tireurs construite une fois par version des données, avec deux
+# index de recherche sur les noms normalisés (minuscules, sans accents) :
+# - préfixes de mots : chaque mot tapé doit commencer un mot du nom, dans
+#   n'importe quel ordre ("christophe turl" trouve "TURLIER Christophe") ;
+# - trigrammes : rattrape les fautes de frappe quand les préfixes ne
+#   suffisent pas.
+# Les sélecteurs n'affichent que les meilleurs résultats de la recherche.
+
+NB_RESULTATS = 30
+SEUIL_TRIGRAMMES = 0.5
+
+
+def normaliser(texte):
+    texte = unicodedata.normalize('NFKD', str(texte))
+    texte = ''.join(c for c in texte if not unicodedata.combining(c))
+    return re.sub(r'[^a-z0-9]+', ' ', texte.lower()).strip()
+
+
+def _trigrammes(mot):
+    mot = f"  {mot} "
+    return {mot[i:i + 3] for i in range(len(mot) - 2)}
+
+
+class Annuaire:
+    def __init__(self, noms):
+        self.noms = list(noms)
+        self._positions = {nom: i for i, nom in enumerate(self.noms)}
+        self.mots = [normaliser(nom).split() for nom in self.noms]
+
+        # Préfixes : liste triée de (mot, numéro du tireur) parcourue par dichotomie
+        self._mots_tries = sorted((mot, i) for i, mots in enumerate(self.mots) for mot in mots)
+        self._cles = [mot for mot, _ in self._mots_tries]
+
+        # Trigrammes : trigramme -> numéros des tireurs
+        self._trigrammes = {}
+        self._nb_trigrammes = []
+        for i, mots in enumerate(self.mots):
+            grammes = set().union(*(_trigrammes(mot) for mot in mots)) if mots else set()
+            self._nb_trigrammes.append(len(grammes))
+            for gramme in grammes:
+                self._trigrammes.setdefault(gramme, []).append(i)
+
+    def __contains__(self, nom):
+        return nom in self._positions
+
+    def _prefixe(self, debut):
+        # Numéros des tireurs dont un mot commence par debut
+        i = bisect.bisect_left(self._cles, debut)
+        trouves = set()
+        while i < len(self._cles) and self._cles[i].startswith(debut):
+            trouves.add(self._mots_tries[i][1])
+            i += 1
+        return trouves
+
+    def rechercher(self, requete, limite=NB_RESULTATS):
+        mots_requete = normaliser(requete).split()
+        if not mots_requete:
+            return self.noms[:limite]
+
+        # 1) Tous les mots tapés sont des débuts de mots du nom ; les mots
+        #    entiers passent devant, puis l'ordre alphabétique
+        candidats = set.intersection(*(self._prefixe(mot) for mot in mots_requete))
+        resultats = sorted(
+            candidats,
+            key=lambda i: (-sum(mot in self.mots[i] for mot in mots_requete), i)
+        )[:limite]
+
+        # 2) Complément par trigrammes : part des trigrammes tapés présents dans
+        #    le nom, puis similarité de Jaccard pour départager
+        if len(resultats) < limite:
+            grammes = set().union(*(_trigrammes(mot) for mot in mots_requete))
+            communs = Counter(i for gramme in grammes for i in self._trigrammes.get(gramme, ()))
+            deja = set(resultats)
+            proches = [
+                (
+                    communs[i] / len(grammes),
+                    communs[i] / (len(grammes) + self._nb_trigrammes[i] - communs[i]),
+                    i
+                )
+                for i in communs if i not in deja
+            ]
+            proches = sorted(proches, key=lambda score: (-score[0], -score[1], score[2]))
+            resultats += [i for couverture, _, i in proches if couverture >= SEUIL_TRIGRAMMES][:limite - len(resultats)]
+
+        return [self.noms[i] for i in resultats]
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def charger_annuaire(version):
+    # Tireurs ayant au moins un match, dans l'ordre alphabétique
+    index = charger_index_tireurs(version)
+    presents = np.diff(index.debuts) > 0
+    return Annuaire(index.tireurs[presents])
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def charger_annuaire_classements(version):
+    # Tireurs ayant au moins un classement (page Résultats), dans l'ordre alphabétique
+    return Annuaire(charger_lignes_tireurs(version))
+
+
+def selecteur_tireur(label, annuaire, defaut, key, optionnel=False, limite=NB_RESULTATS):
+    # Recherche + liste réduite aux meilleurs résultats ; le tireur déjà
+    # choisi (ou le défaut) reste toujours dans la liste
+    recherche = st.text_input(f"🔎 {label}", key=f"{key}_recherche", placeholder="Nom ou prénom")
+
+    # Quand le défaut change (nouvel escrimeur principal), la sélection le suit
+    if st.session_state.get(f"{key}_defaut", defaut) != defaut and key in st.session_state:
+        del st.session_state[key]
+    st.session_state[f"{key}_defaut"] = defaut
+
+    courant = st.session_state.get(key, defaut)
+    if courant not in annuaire and not (optionnel and courant == ''):
+        courant = defaut
+
+    options = annuaire.rechercher(recherche, limite)
+    if courant not in options:
+        options = [courant] + options
+    if optionnel and '' not in options:
+        options = [''] + options
+
+    return st.selectbox(label, options, index=options.index(courant), key=key, label_visibility="collapsed")
+
+
+def selecteur_tireurs_multiple(label, annuaire, key, tous='Tous', limite=NB_RESULTATS):
+    # Variante multiple (filtres) : les tireurs déjà choisis restent proposés
+    recherche = st.text_input(f"🔎 {label}", key=f"{key}_recherche", placeholder="Nom ou prénom")
+
+    choisis = [nom for nom in st.session_state.get(key, [tous]) if nom == tous or nom in annuaire]
+    options = [tous] + choisis + [nom for nom in annuaire.rechercher(recherche, limite) if nom not in choisis]
+    options = list(dict.fromkeys(options))
+
+    return st.multiselect(label, options, default=choisis, key=key, label_visibility="collapsed")
@@ -0,0 +1,63 @@
+import threading
+from collections import OrderedDict
+
+# ===== CACHE LRU PARTAGÉ =====
+# Cache borné au niveau du processus : toutes les sessions Streamlit le
+# partagent. Les entrées les moins récemment utilisées sont évincées au-delà
+# de taille_max. Si plusieurs sessions demandent en même temps une clé
+# absente, une seule la calcule et les autres attendent son résultat.
+# Les valeurs sont partagées : elles ne doivent pas être modifiées en place.
+
+
+class CacheLRU:
+    def __init__(self, taille_max):
+        self.taille_max = taille_max
+        self.succes = 0
+        self.echecs = 0
+        self._entrees = OrderedDict()
+        self._calculs_en_cours = {}
+        self._verrou = threading.Lock()
+
+    def _lire(self, cle):
+        # À appeler sous self._verrou
+        if cle in self._entrees:
+            self._entrees.move_to_end(cle)
+            self.succes += 1
+            return True, self._entrees[cle]
+        return False, None
+
+    def obtenir(self, cle, calcul):
+        with self._verrou:
+            trouve, valeur = self._lire(cle)
+            if trouve:
+                return valeur
+            verrou_cle = self._calculs_en_cours.setdefault(cle, threading.Lock())
+
+        with verrou_cle:
+            with self._verrou:
+                # Une autre session a pu terminer le calcul pendant l'attente
+                trouve, valeur = self._lire(cle)
+                if trouve:
+                    return valeur
+                self.echecs += 1
+
+            try:
+                valeur = calcul()
+                with self._verrou:
+                    self._entrees[cle] = valeur
+                    while len(self._entrees) > self.taille_max:
+                        self._entrees.popitem(last=False)
+            finally:
+                with self._verrou:
+                    self._calculs_en_cours.pop(cle, None)
+
+        return valeur
+
+    def statistiques(self):
+        with self._verrou:
+            return {
+                'entrees': len(self._entrees),
+                'taille_max': self.taille_max,
+                'succes': self.succes,
+                'echecs': self.echecs
+            }
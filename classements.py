@@ -0,0 +1,175 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from cache_lru import CacheLRU
+from donnees import charger_donnees
+
+# ===== TABLES DES CLASSEMENTS =====
+# Tables dérivées de la feuille Data_classements, construites une fois par
+# version des données et partagées par toutes les sessions : une page ne
+# parcourt plus que les classements d'un tireur.
+
+# Clé d'un tableau de compétition (une catégorie d'une compétition)
+CLE_COMPETITION = ['Date', 'Compétition', 'Catégorie']
+# Clé d'une compétition, toutes catégories confondues
+CLE_CALENDRIER = ['Date', 'Compétition']
+
+
+def lignes_par_tireur(df_class):
+    # Tireur -> positions (df_class.iloc) de ses classements, dans l'ordre de la base
+    return {str(tireur): lignes for tireur, lignes in df_class.groupby('Tireur', sort=True).indices.items()}
+
+
+# ===== TAILLE DES COMPÉTITIONS =====
+# Une ligne par (Date, Compétition, Catégorie) : nombre de classés, rang du
+# dernier et type de compétition. Le nombre d'escrimeurs d'un résultat est
+# lu par jointure au lieu d'un filtre sur tous les classements.
+def tailles_competitions(df_class):
+    tailles = df_class.groupby(CLE_COMPETITION, sort=True).agg(
+        participants=('Rang', 'size'),
+        dernier_rang=('Rang', 'max'),
+        type_competition=('CN / CdF', 'first')
+    )
+    tailles['est_cn'] = tailles['type_competition'] == 'CN'
+    return tailles
+
+
+# ===== CALENDRIER DES COMPÉTITIONS =====
+# Compétitions dans l'ordre chronologique, avec leur étiquette d'axe
+# ("saison - compétition") : l'axe de l'historique des résultats.
+def calendrier_competitions(df_class):
+    calendrier = df_class.sort_values('Date', kind='stable').drop_duplicates(subset=CLE_CALENDRIER)
+    calendrier = calendrier[CLE_CALENDRIER + ['Saison']].reset_index(drop=True)
+    calendrier['Label'] = calendrier['Saison'].astype(str) + ' - ' + calendrier['Compétition']
+    return calendrier
+
+
+# ===== MÉDAILLES ET TOURS ATTEINTS =====
+# Le rang de chaque classement est rangé dans le tour atteint, puis compté en
+# un seul regroupement pour tous les tireurs : une ligne par
+# (Tireur, Saison, CN / CdF), une colonne par tour. Le 4e (rare) n'entre dans
+# aucun tour mais compte dans le nombre de compétitions.
+TOURS_ATTEINTS = ['premiers', 'seconds', 'troisiemes', 'quatriemes', 'quarts', 'tableau_16', 'tableau_32']
+BORNES_RANGS = [0, 1, 2, 3, 4, 8, 16, np.inf]
+CLE_MEDAILLES = ['Tireur', 'Saison', 'CN / CdF']
+
+
+def _completer_medailles(comptes):
+    comptes['finales'] = comptes['premiers'] + comptes['seconds']
+    comptes['demi_finales'] = comptes['troisiemes']
+    comptes['medailles'] = comptes['finales'] + comptes['troisiemes']
+    comptes['competitions'] = comptes[TOURS_ATTEINTS].sum(axis=1).astype(np.int32)
+    return comptes
+
+
+def medailles_tireurs(df_class):
+    tours = pd.cut(df_class['Rang'], bins=BORNES_RANGS, labels=TOURS_ATTEINTS)
+    comptes = df_class.groupby([df_class[col] for col in CLE_MEDAILLES] + [tours], observed=True).size()
+    comptes = comptes.unstack(fill_value=0).reindex(columns=TOURS_ATTEINTS, fill_value=0).astype(np.int32)
+    comptes.columns = list(TOURS_ATTEINTS)
+    comptes = comptes.rename(index=str, level='Tireur').sort_index()
+    return _completer_medailles(comptes)
+
+
+def bilan_medailles(medailles, tireur, saison_min, saison_max):
+    # Sommes du tireur sur la plage de saisons, par type de compétition ('CN', 'CdF')
+    # et au total ; tous les compteurs à 0 si aucun classement
+    lignes = medailles.loc[[tireur]] if tireur in medailles.index.levels[0] else medailles.iloc[:0]
+    saisons = lignes.index.get_level_values('Saison')
+    lignes = lignes[(saisons >= saison_min) & (saisons <= saison_max)]
+    par_type = lignes.groupby(level='CN / CdF').sum().reindex(['CN', 'CdF'], fill_value=0)
+    return par_type.sum(), par_type
+
+
+def classement_medailles(medailles, saison_min, saison_max):
+    # Tous les tireurs, classés par or, puis argent, puis bronze (égalités : ordre alphabétique)
+    saisons = medailles.index.get_level_values('Saison')
+    totaux = medailles[(saisons >= saison_min) & (saisons <= saison_max)].groupby(level='Tireur').sum()
+    totaux = totaux[totaux['medailles'] > 0]
+    return totaux.sort_values(['premiers', 'seconds', 'troisiemes'], ascending=False, kind='stable')
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def charger_lignes_tireurs(version):
+    return lignes_par_tireur(charger_donnees(version)[1])
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def charger_tailles_competitions(version):
+    return tailles_competitions(charger_donnees(version)[1])
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def charger_medailles(version):
+    return medailles_tireurs(charger_donnees(version)[1])
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def charger_calendrier(version):
+    return calendrier_competitions(charger_donnees(version)[1])
+
+
+# ===== HISTORIQUE DES RÉSULTATS =====
+# Graphique des places d'un tireur sur toutes les compétitions d'une plage de
+# saisons : une jointure de ses rangs sur le calendrier, gardée en cache par
+# (tireur, plage de saisons). La figure est partagée : ne pas la modifier.
+cache_historiques = CacheLRU(taille_max=64)
+
+
+def _construire_historique(version, tireur, saison_min, saison_max):
+    calendrier = charger_calendrier(version)
+    calendrier = calendrier[(calendrier['Saison'] >= saison_min) & (calendrier['Saison'] <= saison_max)]
+    if len(calendrier) == 0:
+        return None
+
+    # Une place par compétition (la première de la base si plusieurs catégories)
+    df_class = charger_donnees(version)[1]
+    lignes = charger_lignes_tireurs(version).get(tireur, [])
+    rangs = df_class.iloc[lignes].drop_duplicates(subset=CLE_CALENDRIER)[CLE_CALENDRIER + ['Rang']]
+    serie = calendrier.merge(rangs, on=CLE_CALENDRIER, how='left')
+    places = serie['Rang']
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=serie['Label'],
+        y=places,
+        mode='lines+markers+text',
+        line=dict(color='#e74c3c', width=2),
+        marker=dict(size=8, color='#e74c3c'),
+        text=places.map(lambda r: str(int(r)), na_action='ignore').fillna(''),
+        textposition='top center',
+        textfont=dict(size=12),
+        connectgaps=True,
+        hovertemplate='<b>%{x}</b><br>Place: %{y}<extra></extra>'
+    ))
+
+    # Lignes grises horizontales pour 5, 10, 15, 20... (PAS 0) : grille de l'axe
+    max_rang = places.max() if places.notna().any() else 20
+    fig.update_layout(
+        xaxis_title="",
+        yaxis_title="Place",
+        height=500,
+        showlegend=False,
+        xaxis=dict(
+            side='top',
+            tickangle=-90,
+            tickfont=dict(size=14)
+        ),
+        yaxis=dict(
+            autorange='reversed',
+            tickvals=list(range(5, int(max_rang) + 5, 5)),
+            range=[-0.5, max_rang + 2],
+            showgrid=True,
+            gridcolor='lightgray',
+            gridwidth=1
+        )
+    )
+    return fig
+
+
+def historique_resultats(version, tireur, saison_min, saison_max):
+    # Figure plotly, ou None si aucune compétition sur la période
+    cle = (version, tireur, int(saison_min), int(saison_max))
+    return cache_historiques.obtenir(cle, lambda: _construire_historique(version, tireur, saison_min, saison_max))
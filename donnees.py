@@ -0,0 +1,410 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import streamlit as st
+
+# ===== ACCÈS AU CLASSEUR =====
+# Le classeur .xlsm est lent à parser (XML via openpyxl) : après la première
+# lecture, les feuilles utiles sont stockées au format Parquet dans un dossier
+# de cache, identifiées par l'empreinte du classeur (mtime, taille, hash).
+
+FICHIER_CLASSEUR = 'Résultats_Escrime_V5_2.xlsm'
+DOSSIER_CACHE = '.cache_donnees'
+FEUILLES = ['Data_matchs', 'Data_classements']
+
+FICHIER_MANIFESTE = os.path.join(DOSSIER_CACHE, 'manifeste.json')
+
+# Empreintes déjà calculées dans ce processus, par (chemin, mtime, taille)
+_empreintes = {}
+
+
+def _hash_fichier(chemin):
+    sha = hashlib.sha256()
+    with open(chemin, 'rb') as f:
+        for bloc in iter(lambda: f.read(1024 * 1024), b''):
+            sha.update(bloc)
+    return sha.hexdigest()
+
+
+def _lire_manifeste():
+    try:
+        with open(FICHIER_MANIFESTE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def empreinte_classeur(chemin=FICHIER_CLASSEUR):
+    stat = os.stat(chemin)
+    cle = (chemin, stat.st_mtime_ns, stat.st_size)
+
+    if cle not in _empreintes:
+        # Si mtime et taille n'ont pas bougé depuis la dernière construction
+        # du cache, le hash du manifeste est réutilisé sans relire le fichier
+        manifeste = _lire_manifeste()
+        if manifeste.get('mtime_ns') == stat.st_mtime_ns and manifeste.get('taille') == stat.st_size:
+            sha256 = manifeste['sha256']
+        else:
+            sha256 = _hash_fichier(chemin)
+
+        _empreintes[cle] = {
+            'mtime_ns': stat.st_mtime_ns,
+            'taille': stat.st_size,
+            'sha256': sha256
+        }
+
+    return _empreintes[cle]
+
+
+def version_classeur(chemin=FICHIER_CLASSEUR):
+    # Identifiant court de la version des données (change avec le contenu du classeur)
+    return empreinte_classeur(chemin)['sha256'][:16]
+
+
+def _chemin_cache(feuille, version):
+    return os.path.join(DOSSIER_CACHE, f"{feuille}_{version}.parquet")
+
+
+def _ecrire_cache(feuilles, empreinte, version):
+    os.makedirs(DOSSIER_CACHE, exist_ok=True)
+
+    # Écriture atomique : fichier temporaire puis renommage
+    for feuille, df in feuilles.items():
+        chemin = _chemin_cache(feuille, version)
+        df.to_parquet(chemin + '.tmp', index=False)
+        os.replace(chemin + '.tmp', chemin)
+
+    chemin_manifeste = FICHIER_MANIFESTE + '.tmp'
+    with open(chemin_manifeste, 'w', encoding='utf-8') as f:
+        json.dump(empreinte, f)
+    os.replace(chemin_manifeste, FICHIER_MANIFESTE)
+
+    # Supprimer les caches des versions précédentes du classeur
+    for nom in os.listdir(DOSSIER_CACHE):
+        if nom.endswith('.parquet') and not nom.endswith(f"_{version}.parquet"):
+            os.remove(os.path.join(DOSSIER_CACHE, nom))
+
+
+def lire_feuilles(version=None, chemin=FICHIER_CLASSEUR):
+    # version ne sert qu'à retrouver le cache : les feuilles relues depuis le
+    # classeur sont toujours rangées sous l'empreinte du fichier actuel
+    empreinte = empreinte_classeur(chemin)
+    version_actuelle = empreinte['sha256'][:16]
+    if version is None:
+        version = version_actuelle
+
+    chemins = {feuille: _chemin_cache(feuille, version) for feuille in FEUILLES}
+    if all(os.path.exists(c) for c in chemins.values()):
+        return {feuille: pd.read_parquet(c) for feuille, c in chemins.items()}
+
+    # Cache absent ou périmé : un seul parsing du classeur pour toutes les feuilles
+    feuilles = pd.read_excel(chemin, sheet_name=FEUILLES)
+
+    try:
+        _ecrire_cache(feuilles, empreinte, version_actuelle)
+    except (OSError, pa.ArrowException):
+        # Dossier non inscriptible, ou colonne non convertible en Parquet
+        # (types mélangés dans une feuille modifiée à la main) : on continue
+        # avec les feuilles lues, sans cache disque
+        pass
+
+    return feuilles
+
+
+# ===== SCHÉMA COMPACT DES MATCHS =====
+# Les trois colonnes de tireurs partagent un même dictionnaire de noms : un
+# nom a le même code dans 'Tireur 1', 'Tireur 2' et 'Vainqueur', et les
+# comparaisons du type df['Tireur 1'] == esc portent sur des entiers.
+COLONNES_TIREURS = ['Tireur 1', 'Tireur 2', 'Vainqueur']
+COLONNES_CATEGORIELLES = ['Compétition', 'Catégorie', 'Poule / Tableau', 'CN / CdF']
+COLONNES_TOUCHES = ['Touches Tireur 1', 'Touches Tireur 2']
+# Colonnes converties en entiers : une cellule vide y est incompatible
+COLONNES_ENTIERES = COLONNES_TOUCHES + ['Saison']
+
+
+def lignes_incompletes(df_brut):
+    # Matchs dont une colonne entière est vide : numéro de ligne dans la
+    # feuille (en-tête en ligne 1) et colonnes concernées
+    vides = df_brut[COLONNES_ENTIERES].isna()
+    vides = vides[vides.any(axis=1)]
+    return pd.DataFrame({
+        'Ligne': vides.index + 2,
+        'Colonnes vides': [', '.join(vides.columns[ligne]) for ligne in vides.to_numpy()]
+    })
+
+
+def typer_matchs(df):
+    # Les matchs incomplets (voir lignes_incompletes) sont écartés : leur
+    # score ou leur saison ne tient pas dans une colonne entière
+    df = df.dropna(subset=COLONNES_ENTIERES).reset_index(drop=True)
+    df['Date'] = pd.to_datetime(df['Date'])
+
+    noms = pd.concat([df[col] for col in COLONNES_TIREURS]).dropna().unique()
+    type_tireurs = pd.CategoricalDtype(sorted(noms))
+    for col in COLONNES_TIREURS:
+        df[col] = df[col].astype(type_tireurs)
+
+    for col in COLONNES_CATEGORIELLES:
+        df[col] = df[col].astype('category')
+
+    for col in COLONNES_TOUCHES:
+        df[col] = df[col].astype('int8')
+    df['Saison'] = df['Saison'].astype('int16')
+
+    return df
+
+
+def rapport_memoire(df_brut, df_type):
+    # Octets par colonne avant / après typage (vue de debug)
+    octets_brut = df_brut.memory_usage(deep=True, index=False)
+    octets_type = df_type.memory_usage(deep=True, index=False)
+
+    rapport = pd.DataFrame({
+        'Colonne': df_brut.columns,
+        'Type brut': df_brut.dtypes.astype(str).values,
+        'Octets brut': octets_brut.values,
+        'Type compact': df_type.dtypes.reindex(df_brut.columns).astype(str).values,
+        'Octets compact': octets_type.reindex(df_brut.columns).values
+    })
+    total = pd.DataFrame([{
+        'Colonne': 'TOTAL',
+        'Type brut': '',
+        'Octets brut': rapport['Octets brut'].sum(),
+        'Type compact': '',
+        'Octets compact': rapport['Octets compact'].sum()
+    }])
+    rapport = pd.concat([rapport, total], ignore_index=True)
+    rapport['Gain'] = (rapport['Octets brut'] / rapport['Octets compact']).round(1)
+    return rapport
+
+
+# ===== TABLE "POINT DE VUE TIREUR" =====
+# Deux lignes par match, une du point de vue de chaque tireur, triées par
+# tireur puis par position du match : les pages filtrent et agrègent cette
+# table au lieu d'inverser Tireur 1 / Tireur 2 ligne par ligne.
+# 'Ligne' est la position du match dans la table des matchs (df.iloc).
+def construire_perspective(df):
+    lignes = np.arange(len(df), dtype=np.int32)
+    est_poule = df['Poule / Tableau'].str.startswith('Poule', na=False).to_numpy()
+
+    vues = []
+    for tireur, adversaire, marquees, recues in [
+        ('Tireur 1', 'Tireur 2', 'Touches Tireur 1', 'Touches Tireur 2'),
+        ('Tireur 2', 'Tireur 1', 'Touches Tireur 2', 'Touches Tireur 1')
+    ]:
+        vues.append(pd.DataFrame({
+            'Tireur': df[tireur].array,
+            'Adversaire': df[adversaire].array,
+            'Touches Marquées': df[marquees].to_numpy(),
+            'Touches Reçues': df[recues].to_numpy(),
+            'Victoire': (df['Vainqueur'] == df[tireur]).to_numpy(),
+            'Poule': est_poule,
+            'Tour': df['Poule / Tableau'].array,
+            'Saison': df['Saison'].to_numpy(),
+            'Date': df['Date'].to_numpy(),
+            'Ligne': lignes
+        }))
+
+    perspective = pd.concat(vues, ignore_index=True)
+    ordre = np.lexsort((perspective['Ligne'].to_numpy(), perspective['Tireur'].cat.codes.to_numpy()))
+    return perspective.take(ordre).reset_index(drop=True)
+
+
+# ===== INDEX DES TIREURS =====
+# Index inversé : tireur (code du dictionnaire partagé) -> positions triées
+# de ses matchs dans la table des matchs. La perspective étant triée par
+# tireur puis par ligne, les matchs d'un tireur y forment une tranche
+# contiguë : une recherche coûte O(k) au lieu d'un balayage complet.
+class IndexTireurs:
+    def __init__(self, perspective):
+        self.perspective = perspective
+        self.tireurs = perspective['Tireur'].cat.categories
+        codes = perspective['Tireur'].cat.codes.to_numpy()
+        self.debuts = np.searchsorted(codes, np.arange(len(self.tireurs) + 1))
+        self.lignes_matchs = perspective['Ligne'].to_numpy()
+
+    def tranche(self, tireur):
+        code = self.tireurs.get_indexer([tireur])[0]
+        if code < 0:
+            return slice(0, 0)
+        return slice(self.debuts[code], self.debuts[code + 1])
+
+    def lignes(self, tireur):
+        # Positions (df.iloc) des matchs du tireur, dans l'ordre de la base
+        return self.lignes_matchs[self.tranche(tireur)]
+
+    def vue(self, tireur):
+        # Lignes de la perspective du tireur
+        return self.perspective.iloc[self.tranche(tireur)]
+
+
+# ===== INDEX DES COMPÉTITIONS =====
+# Arbre Saison -> Compétition -> Catégorie construit une fois par version :
+# chaque feuille donne les positions (df.iloc) de ses matchs, de ses matchs
+# de tableau et de ses classements (triés par rang), ainsi que les tours
+# présents. Les filtres en cascade de la page Compétition deviennent des
+# lectures de dictionnaire.
+class EntreeCompetition:
+    def __init__(self, lignes_matchs, lignes_tableau, tours, lignes_classement):
+        self.lignes_matchs = lignes_matchs
+        self.lignes_tableau = lignes_tableau
+        self.tours = tours
+        self.lignes_classement = lignes_classement
+
+
+class IndexCompetitions:
+    CLE = ['Saison', 'Compétition', 'Catégorie']
+
+    def __init__(self, df, df_class):
+        phases = df['Poule / Tableau'].to_numpy()
+        est_tableau = (df['Poule / Tableau'].notna() & ~df['Poule / Tableau'].str.startswith('Poule', na=False)).to_numpy()
+
+        # Classements triés par rang (tri stable : l'ordre de la base départage)
+        ordre_rangs = np.argsort(df_class['Rang'].to_numpy(), kind='stable')
+        classements = df_class.iloc[ordre_rangs].groupby(self.CLE, sort=False).indices
+        classements = {
+            (int(saison), competition, categorie): ordre_rangs[positions]
+            for (saison, competition, categorie), positions in classements.items()
+        }
+
+        self.arbre = {}
+        for (saison, competition, categorie), lignes in df.groupby(self.CLE, observed=True, sort=True).indices.items():
+            saison = int(saison)
+            lignes_tableau = lignes[est_tableau[lignes]]
+            self.arbre.setdefault(saison, {}).setdefault(competition, {})[categorie] = EntreeCompetition(
+                lignes_matchs=lignes,
+                lignes_tableau=lignes_tableau,
+                tours=list(pd.unique(phases[lignes_tableau])),
+                lignes_classement=classements.get((saison, competition, categorie), np.array([], dtype=np.int64))
+            )
+
+    def saisons(self):
+        return sorted(self.arbre)
+
+    def competitions(self, saison):
+        return sorted(self.arbre.get(int(saison), {}))
+
+    def categories(self, saison, competition):
+        return sorted(self.arbre.get(int(saison), {}).get(competition, {}))
+
+    def entree(self, saison, competition, categorie):
+        return self.arbre.get(int(saison), {}).get(competition, {}).get(categorie)
+
+
+# ===== INDEX BITMAP DES FILTRES =====
+# Un bitmap compressé (np.packbits, 1 bit par match) par valeur de chaque
+# colonne de filtre à faible cardinalité. Les valeurs choisies d'un filtre
+# se combinent par OU, les filtres entre eux par ET, et la sélection finale
+# est décompressée une seule fois. Les tireurs passent par l'index des
+# tireurs, le vainqueur par ses codes, les dates par une comparaison de jours.
+class IndexFiltres:
+    COLONNES = ['Compétition', 'CN / CdF', 'Catégorie', 'Poule / Tableau', 'Saison']
+
+    def __init__(self, df, index_tireurs):
+        self.nb_lignes = len(df)
+        self.index_tireurs = index_tireurs
+        self.jours = df['Date'].to_numpy().astype('datetime64[D]')
+        self.vainqueurs = df['Vainqueur'].cat.categories
+        self.codes_vainqueurs = df['Vainqueur'].cat.codes.to_numpy()
+
+        # Bornes des dates et vainqueurs présents, pour les options des filtres
+        self.date_min = self.jours.min().astype(object)
+        self.date_max = self.jours.max().astype(object)
+        presents = np.unique(self.codes_vainqueurs[self.codes_vainqueurs >= 0])
+        self.vainqueurs_presents = sorted(self.vainqueurs[presents].astype(str))
+
+        self.bitmaps = {}
+        for col in self.COLONNES:
+            codes, valeurs = pd.factorize(df[col], sort=True)
+            self.bitmaps[col] = {
+                valeur.item() if hasattr(valeur, 'item') else valeur: np.packbits(codes == code)
+                for code, valeur in enumerate(valeurs)
+            }
+
+    def valeurs(self, col):
+        return list(self.bitmaps[col])
+
+    def valeurs_choisies(self, col, valeurs):
+        # OU des bitmaps des valeurs choisies (valeur inconnue : aucun match)
+        bitmaps = self.bitmaps[col]
+        resultat = np.zeros((self.nb_lignes + 7) // 8, dtype=np.uint8)
+        for valeur in valeurs:
+            if valeur in bitmaps:
+                resultat |= bitmaps[valeur]
+        return resultat
+
+    def dates(self, date_min, date_max):
+        return np.packbits((self.jours >= np.datetime64(date_min)) & (self.jours <= np.datetime64(date_max)))
+
+    def tireurs(self, tireurs):
+        # Matchs où l'un des tireurs choisis est Tireur 1 ou Tireur 2
+        masque = np.zeros(self.nb_lignes, dtype=bool)
+        for tireur in tireurs:
+            masque[self.index_tireurs.lignes(tireur)] = True
+        return np.packbits(masque)
+
+    def vainqueurs_choisis(self, vainqueurs):
+        codes = self.vainqueurs.get_indexer(list(vainqueurs))
+        return np.packbits(np.isin(self.codes_vainqueurs, codes[codes >= 0]))
+
+    def lignes(self, bitmaps):
+        # ET des bitmaps puis positions (df.iloc) des matchs retenus
+        selection = np.bitwise_and.reduce(bitmaps) if len(bitmaps) > 0 else \
+            np.full((self.nb_lignes + 7) // 8, 0xFF, dtype=np.uint8)
+        return np.flatnonzero(np.unpackbits(selection, count=self.nb_lignes))
+
+
+def lire_classeur(version=None, chemin=FICHIER_CLASSEUR):
+    # Les deux feuilles en un seul passage, avec les dates typées une fois pour toutes
+    feuilles = lire_feuilles(version, chemin)
+
+    df = typer_matchs(feuilles['Data_matchs'])
+
+    df_class = feuilles['Data_classements']
+    df_class['Date'] = pd.to_datetime(df_class['Date'])
+
+    return df, df_class
+
+
+# Ressource partagée par toutes les sessions et toutes les pages : les frames
+# ne sont ni copiées ni re-sérialisées, elles ne doivent donc jamais être
+# modifiées en place (filtrer puis .copy() avant toute modification)
+@st.cache_resource(max_entries=2, show_spinner="Chargement des données...")
+def charger_donnees(version):
+    return lire_classeur(version)
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def charger_perspective(version):
+    return construire_perspective(charger_donnees(version)[0])
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def charger_index_tireurs(version):
+    return IndexTireurs(charger_perspective(version))
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def charger_index_competitions(version):
+    return IndexCompetitions(*charger_donnees(version))
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def charger_index_filtres(version):
+    return IndexFiltres(charger_donnees(version)[0], charger_index_tireurs(version))
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def charger_lignes_incompletes(version):
+    return lignes_incompletes(lire_feuilles(version)['Data_matchs'])
+
+
+def rapport_memoire_matchs(version):
+    # Le cache Parquet conserve la feuille brute : pas de re-parsing du classeur
+    df_brut = lire_feuilles(version)['Data_matchs']
+    df_type = charger_donnees(version)[0]
+    return rapport_memoire(df_brut, df_type)
@@ -0,0 +1,91 @@
+import codecs
+import io
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from openpyxl import Workbook
+
+# ===== EXPORT DES MATCHS FILTRÉS =====
+# Les fichiers ne sont produits qu'au clic sur le bouton de téléchargement
+# (data=callable). Les lignes retenues sont écrites par blocs dans un seul
+# tampon, directement depuis la table typée : pas de chaîne intermédiaire
+# contenant tout le fichier, pas de copie de la table.
+
+TAILLE_BLOC = 20000
+
+# Format -> (extension, type MIME)
+FORMATS = {
+    'CSV': ('csv', 'text/csv'),
+    'Parquet': ('parquet', 'application/vnd.apache.parquet'),
+    'XLSX': ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+}
+
+
+def _blocs(df, lignes):
+    # Au moins un bloc, éventuellement vide, pour écrire l'en-tête
+    for debut in range(0, max(len(lignes), 1), TAILLE_BLOC):
+        yield df.iloc[lignes[debut:debut + TAILLE_BLOC]]
+
+
+def _ecrire_csv(df, lignes, sortie):
+    # UTF-8 avec BOM pour l'ouverture directe dans Excel, dates en JJ/MM/AAAA
+    sortie.write(codecs.BOM_UTF8)
+    for i, bloc in enumerate(_blocs(df, lignes)):
+        sortie.write(bloc.to_csv(index=False, header=(i == 0), date_format='%d/%m/%Y').encode('utf-8'))
+
+
+def _categories_utilisees(df, lignes):
+    # Catégories présentes dans les lignes retenues, par colonne catégorielle :
+    # les dictionnaires partagés de la table contiennent toutes les valeurs
+    # de la base, qu'il ne faut pas recopier dans le fichier
+    categories = {}
+    for col in df.select_dtypes('category').columns:
+        codes = df[col].cat.codes.to_numpy()[lignes]
+        categories[col] = df[col].cat.categories[np.unique(codes[codes >= 0])]
+    return categories
+
+
+def _ecrire_parquet(df, lignes, sortie):
+    # Un groupe de lignes par bloc, types conservés (catégories, entiers courts, dates).
+    # Mêmes catégories (réduites à la sélection) dans tous les blocs
+    categories = _categories_utilisees(df, lignes)
+    ecrivain = None
+    for bloc in _blocs(df, lignes):
+        bloc = bloc.assign(**{col: bloc[col].cat.set_categories(valeurs) for col, valeurs in categories.items()})
+        table = pa.Table.from_pandas(bloc, preserve_index=False)
+        if ecrivain is None:
+            ecrivain = pq.ParquetWriter(sortie, table.schema)
+        ecrivain.write_table(table)
+    ecrivain.close()
+
+
+def _ecrire_xlsx(df, lignes, sortie):
+    # Classeur en écriture seule : les lignes sont ajoutées au fil des blocs
+    classeur = Workbook(write_only=True)
+    feuille = classeur.create_sheet('Data_matchs')
+    feuille.append(df.columns.tolist())
+    for bloc in _blocs(df, lignes):
+        valeurs = bloc.astype(object).where(bloc.notna(), None)
+        for ligne in valeurs.itertuples(index=False, name=None):
+            feuille.append(ligne)
+    classeur.save(sortie)
+
+
+ECRIVAINS = {
+    'CSV': _ecrire_csv,
+    'Parquet': _ecrire_parquet,
+    'XLSX': _ecrire_xlsx
+}
+
+
+def exporter(df, lignes, format_export):
+    # Fichier complet des lignes (positions df.iloc), dans l'ordre donné
+    sortie = io.BytesIO()
+    ECRIVAINS[format_export](df, lignes, sortie)
+    sortie.seek(0)
+    return sortie
+
+
+def nom_fichier(format_export):
+    return f"data_matchs_filtre.{FORMATS[format_export][0]}"
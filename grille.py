@@ -0,0 +1,35 @@
+import math
+
+# ===== GRILLE PAGINÉE =====
+# La page "Base de données" ne manipule que les positions (df.iloc) des
+# lignes retenues : le tri se fait sur la colonne typée (dates, catégories,
+# entiers) et seule la page visible est extraite, formatée et envoyée au
+# navigateur. La table complète n'est jamais copiée.
+
+TAILLES_PAGE = [25, 50, 100, 250]
+ORDRE_BASE = "Ordre de la base"
+
+
+def nb_pages(nb_lignes, taille_page):
+    return max(1, math.ceil(nb_lignes / taille_page))
+
+
+def trier_lignes(df, lignes, colonne_tri, croissant):
+    # Positions réordonnées selon la colonne (tri stable, valeurs manquantes en dernier)
+    if colonne_tri == ORDRE_BASE:
+        return lignes if croissant else lignes[::-1]
+    cles = df[colonne_tri].iloc[lignes].reset_index(drop=True)
+    ordre = cles.sort_values(ascending=croissant, kind='stable', na_position='last').index.to_numpy()
+    return lignes[ordre]
+
+
+def extraire_page(df, lignes, page, taille_page):
+    debut = (page - 1) * taille_page
+    return df.iloc[lignes[debut:debut + taille_page]]
+
+
+def formater_page(df_page):
+    # Formatage d'affichage limité aux lignes de la page
+    df_affichage = df_page.copy()
+    df_affichage['Date'] = df_affichage['Date'].dt.strftime('%d/%m/%Y')
+    return df_affichage
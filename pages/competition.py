@@ -0,0 +1,67 @@
+import streamlit as st
+
+from donnees import charger_donnees, charger_index_competitions, version_classeur
+from tableau import tableau_competition
+
+version_donnees = version_classeur()
+df_class = charger_donnees(version_donnees)[1]
+
+# ===== PAGE : COMPÉTITION (TABLEAU D'ÉLIMINATION) =====
+st.title("🏆 Compétition - Tableau d'élimination")
+
+# Filtres en cascade lus dans l'index des compétitions
+index_competitions = charger_index_competitions(version_donnees)
+
+with st.container(border=True):
+    col_saison, col_compet, col_cat = st.columns(3)
+    
+    with col_saison:
+        saisons_comp = [s for s in index_competitions.saisons() if s != 2021]
+        saison_comp = st.selectbox("Saison", saisons_comp, key="saison_comp")
+    
+    competitions = index_competitions.competitions(saison_comp)
+    
+    with col_compet:
+        if len(competitions) > 0:
+            competition_comp = st.selectbox("Compétition", competitions, key="compet_comp")
+        else:
+            st.info("Aucune compétition")
+            competition_comp = None
+    
+    if competition_comp:
+        categories = index_competitions.categories(saison_comp, competition_comp)
+        
+        with col_cat:
+            if len(categories) > 0:
+                categorie_comp = st.selectbox("Catégorie", categories, key="cat_comp")
+            else:
+                st.info("Aucune catégorie")
+                categorie_comp = None
+    else:
+        categorie_comp = None
+
+if competition_comp and categorie_comp:
+    # HTML du tableau construit une fois par compétition, puis servi depuis le cache
+    tableau_html = tableau_competition(version_donnees, saison_comp, competition_comp, categorie_comp)
+    
+    if tableau_html is not None:
+        col_tableau, col_classement = st.columns([4, 1])
+        
+        with col_classement:
+            st.markdown("### Classement Final")
+            entree_comp = index_competitions.entree(saison_comp, competition_comp, categorie_comp)
+            df_class_final = df_class.iloc[entree_comp.lignes_classement]
+            
+            if len(df_class_final) > 0:
+                for _, row in df_class_final.iterrows():
+                    st.markdown(f"**{int(row['Rang'])}.** {row['Tireur']}")
+        
+        with col_tableau:
+            html, hauteur = tableau_html
+            
+            import streamlit.components.v1 as components
+            components.html(html, height=hauteur, scrolling=True)
+    else:
+        st.info("Aucun match de tableau")
+else:
+    st.info("Veuillez sélectionner une saison, une compétition et une catégorie")
@@ -0,0 +1,151 @@
+import streamlit as st
+
+from annuaire import charger_annuaire, selecteur_tireurs_multiple
+from donnees import charger_donnees, charger_index_filtres, version_classeur
+from export import FORMATS, exporter, nom_fichier
+from grille import ORDRE_BASE, TAILLES_PAGE, extraire_page, formater_page, nb_pages, trier_lignes
+
+version_donnees = version_classeur()
+df = charger_donnees(version_donnees)[0]
+annuaire = charger_annuaire(version_donnees)
+
+# ===== PAGE : BASE DE DONNÉES DES MATCHS =====
+st.title("⚔️ Base de données des matchs")
+
+# Formater le nombre sans séparateur de milliers
+st.info(f"**{len(df)} matchs** dans la base de données")
+
+# Section des filtres
+st.subheader("🔍 Filtres")
+
+index_filtres = charger_index_filtres(version_donnees)
+
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    # Filtre Date (bornes lues dans l'index)
+    date_min = st.date_input(
+        "Date minimum",
+        value=index_filtres.date_min,
+        min_value=index_filtres.date_min,
+        max_value=index_filtres.date_max
+    )
+    date_max = st.date_input(
+        "Date maximum",
+        value=index_filtres.date_max,
+        min_value=index_filtres.date_min,
+        max_value=index_filtres.date_max
+    )
+
+with col2:
+    # Filtre Compétition
+    competitions = ['Toutes'] + index_filtres.valeurs('Compétition')
+    competition_filtre = st.multiselect('Compétition', competitions, default=['Toutes'])
+
+with col3:
+    # Filtre CN / CdF
+    types = ['Tous'] + index_filtres.valeurs('CN / CdF')
+    type_filtre = st.multiselect('CN / CdF', types, default=['Tous'])
+
+with col4:
+    # Filtre Catégorie
+    categories = ['Toutes'] + index_filtres.valeurs('Catégorie')
+    categorie_filtre = st.multiselect('Catégorie', categories, default=['Toutes'])
+
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    # Filtre Poule / Tableau
+    phases = ['Toutes'] + index_filtres.valeurs('Poule / Tableau')
+    phase_filtre = st.multiselect('Poule / Tableau', phases, default=['Toutes'])
+
+with col2:
+    # Filtre Tireur
+    tireur_filtre = selecteur_tireurs_multiple('Tireur (n\'importe lequel)', annuaire, key="tireurs_consultation")
+
+with col3:
+    # Filtre Saison
+    saisons = index_filtres.valeurs('Saison')
+    saison_filtre = st.multiselect('Saison', ['Toutes'] + saisons, default=['Toutes'])
+
+with col4:
+    # Filtre Vainqueur
+    vainqueurs = ['Tous'] + index_filtres.vainqueurs_presents
+    vainqueur_filtre = st.multiselect('Vainqueur', vainqueurs, default=['Tous'])
+
+# Application des filtres : ET des bitmaps de chaque filtre, une seule sélection à la fin
+bitmaps = [index_filtres.dates(date_min, date_max)]
+
+# Filtres Compétition, CN / CdF, Catégorie, Poule / Tableau et Saison
+for colonne, choix, tout in [
+    ('Compétition', competition_filtre, 'Toutes'),
+    ('CN / CdF', type_filtre, 'Tous'),
+    ('Catégorie', categorie_filtre, 'Toutes'),
+    ('Poule / Tableau', phase_filtre, 'Toutes'),
+    ('Saison', saison_filtre, 'Toutes')
+]:
+    if tout not in choix and len(choix) > 0:
+        bitmaps.append(index_filtres.valeurs_choisies(colonne, choix))
+
+# Filtre Tireur
+if 'Tous' not in tireur_filtre and len(tireur_filtre) > 0:
+    bitmaps.append(index_filtres.tireurs(tireur_filtre))
+
+# Filtre Vainqueur
+if 'Tous' not in vainqueur_filtre and len(vainqueur_filtre) > 0:
+    bitmaps.append(index_filtres.vainqueurs_choisis(vainqueur_filtre))
+
+# Positions des matchs retenus (le nombre total ne dépend pas de la page)
+lignes_filtre = index_filtres.lignes(bitmaps)
+nb_resultats = len(lignes_filtre)
+
+# Affichage des résultats
+st.markdown("---")
+st.subheader(f"📊 Résultats : {nb_resultats} matchs")
+
+# Tri et pagination côté serveur : seule la page visible est formatée et envoyée
+col_tri, col_ordre, col_taille, col_page = st.columns(4)
+
+with col_tri:
+    colonne_tri = st.selectbox("Trier par", [ORDRE_BASE] + df.columns.tolist(), key="tri_consultation")
+
+with col_ordre:
+    ordre_tri = st.radio("Ordre", ["Croissant", "Décroissant"], horizontal=True, key="ordre_consultation")
+
+with col_taille:
+    taille_page = st.selectbox("Lignes par page", TAILLES_PAGE, index=1, key="taille_page_consultation")
+
+with col_page:
+    total_pages = nb_pages(nb_resultats, taille_page)
+    page_courante = st.number_input(f"Page (sur {total_pages})", min_value=1, max_value=total_pages, value=1, step=1)
+
+lignes_triees = trier_lignes(df, lignes_filtre, colonne_tri, ordre_tri == "Croissant")
+df_affichage = formater_page(extraire_page(df, lignes_triees, page_courante, taille_page))
+
+if nb_resultats > 0:
+    premiere_ligne = (page_courante - 1) * taille_page + 1
+    st.caption(f"Matchs {premiere_ligne} à {premiere_ligne + len(df_affichage) - 1} sur {nb_resultats}")
+
+# Afficher la page avec toutes les colonnes dans l'ordre original
+st.dataframe(
+    df_affichage,
+    use_container_width=True,
+    hide_index=True,
+    height=min(550, 35 * (len(df_affichage) + 1) + 3)
+)
+
+# Export de toutes les lignes filtrées, dans l'ordre affiché : le fichier
+# n'est produit qu'au clic sur le bouton
+col_format, col_bouton = st.columns([1, 3])
+
+with col_format:
+    format_export = st.radio("Format", list(FORMATS), horizontal=True, key="format_export")
+
+with col_bouton:
+    st.download_button(
+        label=f"📥 Télécharger les résultats ({format_export})",
+        data=lambda: exporter(df, lignes_triees, format_export),
+        file_name=nom_fichier(format_export),
+        mime=FORMATS[format_export][1],
+        on_click="ignore"
+    )
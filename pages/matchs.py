@@ -0,0 +1,444 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from annuaire import charger_annuaire, selecteur_tireur
+from donnees import charger_donnees, charger_index_tireurs, version_classeur
+from statistiques import evolution_tireur, rankings_matchs
+
+version_donnees = version_classeur()
+df = charger_donnees(version_donnees)[0]
+index_tireurs = charger_index_tireurs(version_donnees)
+annuaire = charger_annuaire(version_donnees)
+
+# ===== PAGE : MATCHS =====
+st.title("📊 Matchs")
+
+# Filtres en haut
+col1, col2 = st.columns([2, 1])
+
+with col1:
+    # Utiliser l'escrimeur principal comme défaut
+    escrimeur_defaut = st.session_state.get('escrimeur_principal', 'TURLIER Christophe')
+    if escrimeur_defaut not in annuaire:
+        escrimeur_defaut = annuaire.noms[0]
+    
+    escrimeur = selecteur_tireur("Sélectionner un escrimeur", annuaire, escrimeur_defaut, key="escrimeur_matchs")
+
+with col2:
+    # Filtre saisons (au lieu d'années)
+    saisons = sorted([s for s in df['Saison'].unique() if s != 2021])  # Exclure 2021
+    saison_min, saison_max = st.select_slider(
+        "Plage de saisons",
+        options=saisons,
+        value=(min(saisons), max(saisons))
+    )
+
+# Filtrer la table "point de vue tireur" pour l'escrimeur et la plage de saisons
+vue_escrimeur = index_tireurs.vue(escrimeur)
+vue_escrimeur = vue_escrimeur[
+    (vue_escrimeur['Saison'] >= saison_min) &
+    (vue_escrimeur['Saison'] <= saison_max)
+]
+
+# Matchs de l'escrimeur (ordre de la base) avec ses touches et son adversaire
+df_escrimeur = df.iloc[vue_escrimeur['Ligne']].copy()
+df_escrimeur['Touches Marquées'] = vue_escrimeur['Touches Marquées'].to_numpy()
+df_escrimeur['Touches Reçues'] = vue_escrimeur['Touches Reçues'].to_numpy()
+df_escrimeur['Adversaire'] = vue_escrimeur['Adversaire'].to_numpy()
+
+# Séparer poules et tableaux
+df_poules = df_escrimeur[df_escrimeur['Poule / Tableau'].str.startswith('Poule', na=False)].copy()
+
+# Filtre pour les tableaux : TOUT ce qui ne commence PAS par "Poule"
+df_tableaux = df_escrimeur[~df_escrimeur['Poule / Tableau'].str.startswith('Poule', na=False) & df_escrimeur['Poule / Tableau'].notna()].copy()
+
+# Fonction pour calculer les stats avec rankings (table partagée entre les sessions,
+# calculée depuis le cube des saisons)
+def calculer_stats_avec_ranking(est_poule):
+    df_stats = rankings_matchs(version_donnees, saison_min, saison_max, est_poule)
+    
+    if escrimeur not in df_stats.index:
+        return None
+    
+    stats = df_stats.loc[escrimeur]
+    
+    return {
+        'victoires': int(stats['victoires']),
+        'defaites': int(stats['defaites']),
+        'total': int(stats['total']),
+        'pct_victoires': stats['pct_victoires'],
+        'touches_marquees_moy': stats['touches_marquees_moy'],
+        'touches_recues_moy': stats['touches_recues_moy'],
+        'touches_marquees_victoire': stats['touches_marquees_victoire'],
+        'touches_recues_victoire': stats['touches_recues_victoire'],
+        'touches_marquees_defaite': stats['touches_marquees_defaite'],
+        'rang_total': int(stats['rang_total']),
+        'rang_pct': int(stats['rang_pct']),
+        'rang_tm': int(stats['rang_tm']),
+        'rang_tr': int(stats['rang_tr']),
+        'rang_trv': int(stats['rang_trv']),
+        'rang_tmd': int(stats['rang_tmd']),
+        'total_tireurs': int((df_stats['rang_total'] > 0).sum())
+    }
+
+# Calculer les stats pour poules et tableaux avec rankings
+stats_poules = calculer_stats_avec_ranking(True)
+stats_tableaux = calculer_stats_avec_ranking(False)
+
+st.markdown("---")
+st.subheader(f"Statistiques - {escrimeur}")
+
+# Afficher les deux camemberts côte à côte avec encadrements
+col1, col2 = st.columns(2)
+
+with col1:
+    # Conteneur avec bordure pour poules
+    with st.container(border=True):
+        st.markdown("#### Matchs de Poule")
+        st.markdown("")  # Petite marge
+        if stats_poules and stats_poules['total'] > 0:
+            fig_poules = go.Figure(data=[go.Pie(
+                labels=['Victoires', 'Défaites'],
+                values=[stats_poules['victoires'], stats_poules['defaites']],
+                hole=0.3,
+                marker_colors=['#2ecc71', '#e74c3c'],
+                textinfo='value',
+                textposition='inside'
+            )])
+            
+            fig_poules.update_layout(
+                showlegend=True,
+                height=350,
+                margin=dict(t=20, b=20, l=20, r=20)
+            )
+            
+            st.plotly_chart(fig_poules, use_container_width=True)
+            
+            st.markdown("")  # Petite marge
+            
+            # Statistiques poules
+            st.markdown("**Statistiques Poules :**")
+            st.write(f"• Nombre de matchs tirés : **{stats_poules['total']}** (rang {stats_poules['rang_total']}/{stats_poules['total_tireurs']})")
+            st.write(f"• % de victoires : **{stats_poules['pct_victoires']:.1f}%** (rang {stats_poules['rang_pct']}/{stats_poules['total_tireurs']})")
+            st.write(f"• Touches marquées en moyenne par match : **{stats_poules['touches_marquees_moy']:.2f}** (rang {stats_poules['rang_tm']}/{stats_poules['total_tireurs']})")
+            st.write(f"• Touches reçues en moyenne par match : **{stats_poules['touches_recues_moy']:.2f}** (rang {stats_poules['rang_tr']}/{stats_poules['total_tireurs']})")
+            st.write(f"• Touches marquées en moyenne en cas de défaite : **{stats_poules['touches_marquees_defaite']:.2f}** (rang {stats_poules['rang_tmd']}/{stats_poules['total_tireurs']})")
+            st.write(f"• Touches reçues en moyenne en cas de victoire : **{stats_poules['touches_recues_victoire']:.2f}** (rang {stats_poules['rang_trv']}/{stats_poules['total_tireurs']})")
+        else:
+            st.info("Aucun match de poule trouvé pour cet escrimeur sur cette période.")
+
+with col2:
+    # Conteneur avec bordure pour tableaux
+    with st.container(border=True):
+        st.markdown("#### Matchs de Tableau")
+        st.markdown("")  # Petite marge
+        if stats_tableaux and stats_tableaux['total'] > 0:
+            fig_tableaux = go.Figure(data=[go.Pie(
+                labels=['Victoires', 'Défaites'],
+                values=[stats_tableaux['victoires'], stats_tableaux['defaites']],
+                hole=0.3,
+                marker_colors=['#2ecc71', '#e74c3c'],
+                textinfo='value',
+                textposition='inside'
+            )])
+            
+            fig_tableaux.update_layout(
+                showlegend=True,
+                height=350,
+                margin=dict(t=20, b=20, l=20, r=20)
+            )
+            
+            st.plotly_chart(fig_tableaux, use_container_width=True)
+            
+            st.markdown("")  # Petite marge
+            
+            # Statistiques tableaux
+            st.markdown("**Statistiques Tableaux :**")
+            st.write(f"• Nombre de matchs tirés : **{stats_tableaux['total']}** (rang {stats_tableaux['rang_total']}/{stats_tableaux['total_tireurs']})")
+            st.write(f"• % de victoires : **{stats_tableaux['pct_victoires']:.1f}%** (rang {stats_tableaux['rang_pct']}/{stats_tableaux['total_tireurs']})")
+            st.write(f"• Touches marquées en moyenne par match : **{stats_tableaux['touches_marquees_moy']:.2f}** (rang {stats_tableaux['rang_tm']}/{stats_tableaux['total_tireurs']})")
+            st.write(f"• Touches reçues en moyenne par match : **{stats_tableaux['touches_recues_moy']:.2f}** (rang {stats_tableaux['rang_tr']}/{stats_tableaux['total_tireurs']})")
+            st.write(f"• Touches marquées en moyenne en cas de défaite : **{stats_tableaux['touches_marquees_defaite']:.2f}** (rang {stats_tableaux['rang_tmd']}/{stats_tableaux['total_tireurs']})")
+            st.write(f"• Touches reçues en moyenne en cas de victoire : **{stats_tableaux['touches_recues_victoire']:.2f}** (rang {stats_tableaux['rang_trv']}/{stats_tableaux['total_tireurs']})")
+        else:
+            st.info("Aucun match de tableau trouvé pour cet escrimeur sur cette période.")
+
+# Histogramme des résultats
+
+with st.container(border=True):
+    st.subheader("Historique des matchs")
+    st.markdown("")  # Petite marge
+    
+    if len(df_escrimeur) > 0:
+        # Garder l'ordre de la base de données (pas de tri par date)
+        df_histo = df_escrimeur.copy()
+        
+        # Calculer l'ordonnée pour chaque match - UTILISER LA COLONNE VAINQUEUR
+        # Poule : +1 / -1, Tableau : +2 / -2
+        est_poule = vue_escrimeur['Poule'].to_numpy()
+        est_victoire = vue_escrimeur['Victoire'].to_numpy()
+        df_histo['Ordonnée'] = np.where(est_poule, 1, 2) * np.where(est_victoire, 1, -1)
+        
+        # Créer les couleurs (vert pour positif, rouge pour négatif)
+        colors = ['#2ecc71' if val > 0 else '#e74c3c' for val in df_histo['Ordonnée']]
+        
+        # Formater les dates pour affichage
+        df_histo['Date_str'] = df_histo['Date'].dt.strftime('%d/%m/%Y')
+        
+        # Créer l'histogramme
+        fig_histo = go.Figure(data=[
+            go.Bar(
+                x=list(range(len(df_histo))),
+                y=df_histo['Ordonnée'],
+                marker_color=colors,
+                hovertemplate='<b>Match %{x}</b><br>' +
+                             'Date: %{customdata[0]}<br>' +
+                             'Compétition: %{customdata[1]}<br>' +
+                             'Adversaire: %{customdata[2]}<br>' +
+                             'Score: %{customdata[3]} - %{customdata[4]}<br>' +
+                             'Type: %{customdata[5]}<br>' +
+                             '<extra></extra>',
+                customdata=df_histo[['Date_str', 'Compétition', 'Adversaire',
+                                    'Touches Marquées', 'Touches Reçues', 'Poule / Tableau']].values
+            )
+        ])
+        
+        fig_histo.update_layout(
+            xaxis_title="Numéro du match",
+            yaxis_title="Résultat",
+            height=400,
+            showlegend=False,
+            yaxis=dict(
+                tickvals=[-2, -1, 0, 1, 2],
+                ticktext=['Défaite Tableau', 'Défaite Poule', '', 'Victoire Poule', 'Victoire Tableau']
+            )
+        )
+        
+        st.plotly_chart(fig_histo, use_container_width=True)
+    else:
+        st.info("Aucun match trouvé pour cet escrimeur sur cette période.")
+
+# Graphiques d'évolution par saison : matchs et victoires par saison et par
+# phase en un seul calcul (cube des saisons, en cache), hors saison 2021
+evolution = evolution_tireur(version_donnees, escrimeur, saison_min, saison_max)
+evolution = evolution[evolution.index != 2021]
+evolution_poules = evolution[evolution['matchs_poules'] > 0]
+evolution_tableaux = evolution[evolution['matchs_tableaux'] > 0]
+
+with st.container(border=True):
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Évolution du % de victoires par saison")
+        st.markdown("")  # Petite marge
+        
+        if len(df_escrimeur) > 0:
+            # Créer le graphique
+            fig_evolution = go.Figure()
+            
+            # Ligne pour les poules
+            if len(evolution_poules) > 0:
+                fig_evolution.add_trace(go.Scatter(
+                    x=evolution_poules.index,
+                    y=evolution_poules['pct_poules'],
+                    mode='lines+markers',
+                    name='Poules',
+                    line=dict(color='#3498db', width=2),
+                    marker=dict(size=8)
+                ))
+            
+            # Ligne pour les tableaux
+            if len(evolution_tableaux) > 0:
+                fig_evolution.add_trace(go.Scatter(
+                    x=evolution_tableaux.index,
+                    y=evolution_tableaux['pct_tableaux'],
+                    mode='lines+markers',
+                    name='Tableaux',
+                    line=dict(color='#e74c3c', width=2),
+                    marker=dict(size=8)
+                ))
+            
+            fig_evolution.update_layout(
+                xaxis_title="Saison",
+                yaxis_title="% de victoires",
+                height=400,
+                showlegend=True,
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=1.02,
+                    xanchor="right",
+                    x=1
+                ),
+                yaxis=dict(range=[0, 110], dtick=20),  # De 0 à 110% avec graduation tous les 20%
+                xaxis=dict(
+                    dtick=1,  # Forcer l'affichage par pas de 1
+                    tickmode='linear'
+                )
+            )
+            
+            st.plotly_chart(fig_evolution, use_container_width=True)
+        else:
+            st.info("Aucune donnée pour cet escrimeur sur cette période.")
+    
+    with col2:
+        st.subheader("Nombre de victoires par saison")
+        st.markdown("")  # Petite marge
+        
+        if len(df_escrimeur) > 0:
+            # Créer l'histogramme
+            fig_victoires = go.Figure()
+            
+            fig_victoires.add_trace(go.Bar(
+                x=evolution.index,
+                y=evolution['victoires_poules'],
+                name='Poules',
+                marker_color='#3498db'
+            ))
+            
+            fig_victoires.add_trace(go.Bar(
+                x=evolution.index,
+                y=evolution['victoires_tableaux'],
+                name='Tableaux',
+                marker_color='#e74c3c'
+            ))
+            
+            fig_victoires.update_layout(
+                xaxis_title="Saison",
+                yaxis_title="Nombre de victoires",
+                height=400,
+                showlegend=True,
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=1.02,
+                    xanchor="right",
+                    x=1
+                ),
+                barmode='group',
+                xaxis=dict(
+                    dtick=1,
+                    tickmode='linear'
+                )
+            )
+            
+            st.plotly_chart(fig_victoires, use_container_width=True)
+        else:
+            st.info("Aucune donnée pour cet escrimeur sur cette période.")
+
+# Tableaux des derniers matchs (SANS ligne de séparation)
+
+col1, col2 = st.columns(2)
+
+with col1:
+    with st.container(border=True):
+        st.subheader("15 derniers matchs de Poule")
+        
+        if len(df_poules) > 0:
+            # Prendre les 15 derniers matchs de poule
+            df_derniers_poules = df_poules.sort_values('Date', ascending=False).head(15).copy()
+            
+            # Créer le tableau d'affichage
+            tableau_poules = []
+            for _, row in df_derniers_poules.iterrows():
+                victoire = row['Vainqueur'] == escrimeur  # CORRECTION: Utiliser Vainqueur
+                adversaire = row['Adversaire']
+                
+                tableau_poules.append({
+                    'Saison': int(row['Saison']),
+                    'V/D': 'V' if victoire else 'D',
+                    'Date': row['Date'].strftime('%d/%m/%y'),
+                    'Compétition': row['Compétition'],
+                    'Score': f"{int(row['Touches Marquées'])} - {int(row['Touches Reçues'])}",
+                    'Adversaire': adversaire,
+                    '_victoire': victoire  # Colonne cachée pour le style
+                })
+            
+            df_affichage_poules = pd.DataFrame(tableau_poules)
+            
+            # Supprimer la colonne _victoire
+            victoires_list = df_affichage_poules['_victoire'].tolist()
+            df_affichage_final = df_affichage_poules.drop(columns=['_victoire'])
+            
+            # Créer un DataFrame de styles basé sur les victoires
+            def get_color(val, row_idx):
+                if victoires_list[row_idx]:
+                    return 'color: green'
+                else:
+                    return 'color: red'
+            
+            # Créer une matrice de styles
+            styles = pd.DataFrame('', index=df_affichage_final.index, columns=df_affichage_final.columns)
+            for idx in df_affichage_final.index:
+                for col in df_affichage_final.columns:
+                    styles.at[idx, col] = get_color(df_affichage_final.at[idx, col], idx)
+            
+            # Appliquer le style
+            df_styled = df_affichage_final.style.apply(lambda x: styles, axis=None)
+            
+            st.dataframe(df_styled, use_container_width=True, hide_index=True, height=550)
+        else:
+            st.info("Aucun match de poule pour cet escrimeur.")
+
+with col2:
+    with st.container(border=True):
+        st.subheader("15 derniers matchs de Tableau")
+        
+        if len(df_tableaux) > 0:
+            # Prendre les 15 derniers matchs de tableau
+            df_derniers_tableaux = df_tableaux.sort_values('Date', ascending=False).head(15).copy()
+            
+            # Dictionnaire de transformation pour Tour
+            transformation_tour = {
+                "Tableau de 32": "1/16e",
+                "Tableau de 16": "1/8e",
+                "Quart de finale": "1/4",
+                "Demi finale": "1/2",
+                "Finale": "F"
+            }
+            
+            # Créer le tableau d'affichage
+            tableau_tableaux = []
+            for _, row in df_derniers_tableaux.iterrows():
+                victoire = row['Vainqueur'] == escrimeur  # CORRECTION: Utiliser Vainqueur
+                adversaire = row['Adversaire']
+                tour = transformation_tour.get(row['Poule / Tableau'], row['Poule / Tableau'])
+                
+                tableau_tableaux.append({
+                    'Saison': int(row['Saison']),
+                    'V/D': 'V' if victoire else 'D',
+                    'Date': row['Date'].strftime('%d/%m/%y'),
+                    'Compétition': row['Compétition'],
+                    'Tour': tour,
+                    'Score': f"{int(row['Touches Marquées'])} - {int(row['Touches Reçues'])}",
+                    'Adversaire': adversaire,
+                    '_victoire': victoire  # Colonne cachée pour le style
+                })
+            
+            df_affichage_tableaux = pd.DataFrame(tableau_tableaux)
+            
+            # Supprimer la colonne _victoire
+            victoires_list_tableaux = df_affichage_tableaux['_victoire'].tolist()
+            df_affichage_final_tableaux = df_affichage_tableaux.drop(columns=['_victoire'])
+            
+            # Créer un DataFrame de styles basé sur les victoires
+            def get_color_tableau(val, row_idx):
+                if victoires_list_tableaux[row_idx]:
+                    return 'color: green'
+                else:
+                    return 'color: red'
+            
+            # Créer une matrice de styles
+            styles_tableaux = pd.DataFrame('', index=df_affichage_final_tableaux.index, columns=df_affichage_final_tableaux.columns)
+            for idx in df_affichage_final_tableaux.index:
+                for col in df_affichage_final_tableaux.columns:
+                    styles_tableaux.at[idx, col] = get_color_tableau(df_affichage_final_tableaux.at[idx, col], idx)
+            
+            # Appliquer le style
+            df_styled_tableaux = df_affichage_final_tableaux.style.apply(lambda x: styles_tableaux, axis=None)
+            
+            st.dataframe(df_styled_tableaux, use_container_width=True, hide_index=True, height=550)
+        else:
+            st.info("Aucun match de tableau pour cet escrimeur.")
@@ -0,0 +1,399 @@
+import streamlit as st
+import plotly.graph_objects as go
+
+from annuaire import charger_annuaire, selecteur_tireur
+from donnees import charger_donnees, version_classeur
+from rangs import ordre_classement
+from statistiques import rangs_rankings, rankings_complets
+
+version_donnees = version_classeur()
+df = charger_donnees(version_donnees)[0]
+annuaire = charger_annuaire(version_donnees)
+
+# ===== PAGE : RANKINGS =====
+st.title("🏅 Rankings")
+
+# Initialiser le ranking par défaut
+if 'ranking_choisi' not in st.session_state:
+    st.session_state.ranking_choisi = "Nombre total de matches tirés"
+
+# Sélection escrimeur et saisons
+with st.container(border=True):
+    col_esc, col_saisons = st.columns([2, 1])
+    
+    with col_saisons:
+        saisons_rankings = sorted([s for s in df['Saison'].unique() if s != 2021])
+        saison_min_rank, saison_max_rank = st.select_slider(
+            "Plage de saisons",
+            options=saisons_rankings,
+            value=(min(saisons_rankings), max(saisons_rankings)),
+            key="saisons_rankings"
+        )
+    
+    with col_esc:
+        # Pré-sélectionner l'escrimeur principal
+        escrimeur_principal_rankings = st.session_state.get('escrimeur_principal', '')
+        if escrimeur_principal_rankings not in annuaire:
+            escrimeur_principal_rankings = ''
+        
+        escrimeur_selectionne = selecteur_tireur(
+            "Sélectionner un escrimeur (optionnel)",
+            annuaire,
+            escrimeur_principal_rankings,
+            key="esc_rankings",
+            optionnel=True
+        )
+
+# Calculer les statistiques pour tous les tireurs (au moins 10 matchs sur la période)
+df_stats_complet = rankings_complets(version_donnees, saison_min_rank, saison_max_rank)
+
+
+# Sélecteur de statistique, podium et histogramme dans un fragment : changer
+# de statistique ne réexécute que ce bloc, avec les statistiques déjà calculées
+# (un tri lu dans la matrice des rangs et le rendu du graphique)
+@st.fragment
+def classement_rankings(df_stats_complet, rangs, escrimeur_selectionne):
+    # Zone de sélection avec TABS et BOUTONS RADIO
+    with st.container(border=True):
+        # Initialiser le ranking par défaut
+        if 'ranking_choisi' not in st.session_state:
+            st.session_state.ranking_choisi = 'Nombre total de matches tirés'
+        
+        # Tabs pour les catégories
+        tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+            "📋 MATCH", 
+            "🏆 VICTOIRES", 
+            "⚔️ TOUCHES", 
+            "🐔 TOUCHES POULE", 
+            "📊 TOUCHES TABLEAU", 
+            "🏅 COMPETITIONS"
+        ])
+        
+        with tab1:
+            choice = st.radio(
+                "",
+                [
+                    "Nombre total de matches tirés",
+                    "Nombre de matches en poule",
+                    "Nombre de matches de tableau"
+                ],
+                index=0,
+                label_visibility="collapsed",
+                key="radio_match",
+                on_change=lambda: setattr(st.session_state, 'ranking_choisi', 
+                                         st.session_state.radio_match)
+            )
+        
+        with tab2:
+            choice = st.radio(
+                "",
+                [
+                    "% total de victoires",
+                    "% de victoires en poules",
+                    "% de victoires dans le tableau",
+                    "Nombre de victoires",
+                    "Nombre de victoires serrées",
+                    "Nombre de défaites serrées",
+                    "Nerf d'acier"
+                ],
+                index=0,
+                label_visibility="collapsed",
+                key="radio_victoires",
+                on_change=lambda: setattr(st.session_state, 'ranking_choisi', 
+                                         st.session_state.radio_victoires)
+            )
+        
+        with tab3:
+            choice = st.radio(
+                "",
+                [
+                    "Nombre total de touches marquées",
+                    "Nombre moyen de touches marquées par compétition",
+                    "Nombre de touches reçues",
+                    "Nombre moyen de touches reçues par compétition"
+                ],
+                index=0,
+                label_visibility="collapsed",
+                key="radio_touches",
+                on_change=lambda: setattr(st.session_state, 'ranking_choisi', 
+                                         st.session_state.radio_touches)
+            )
+        
+        with tab4:
+            choice = st.radio(
+                "",
+                [
+                    "Nombre de touches marquées en poule",
+                    "Nombre de touches reçues en poule",
+                    "Nombre de touches marquées en moyenne par match de poule",
+                    "Nombre de touches reçues en moyenne par match de poule",
+                    "Nombre de matchs à 5-4"
+                ],
+                index=0,
+                label_visibility="collapsed",
+                key="radio_poule",
+                on_change=lambda: setattr(st.session_state, 'ranking_choisi', 
+                                         st.session_state.radio_poule)
+            )
+        
+        with tab5:
+            choice = st.radio(
+                "",
+                [
+                    "Nombre de touches marquées dans le tableau",
+                    "Nombre de touches reçues dans le tableau",
+                    "Nombre de touches marquées en moy. par match de tableau",
+                    "Nombre de touches reçues en moy. par match de tableau",
+                    "Nombre de matchs à 10-9"
+                ],
+                index=0,
+                label_visibility="collapsed",
+                key="radio_tableau",
+                on_change=lambda: setattr(st.session_state, 'ranking_choisi', 
+                                         st.session_state.radio_tableau)
+            )
+        
+        with tab6:
+            choice = st.radio(
+                "",
+                [
+                    "Nombre de compétitions gagnées",
+                    "Nombre de podiums",
+                    "Nombre de participations"
+                ],
+                index=0,
+                label_visibility="collapsed",
+                key="radio_compet",
+                on_change=lambda: setattr(st.session_state, 'ranking_choisi', 
+                                         st.session_state.radio_compet)
+            )
+    
+    # Obtenir le ranking choisi
+    ranking_choisi = st.session_state.ranking_choisi
+    
+    # N'afficher le graphique que si un ranking est choisi
+    if ranking_choisi:        
+
+        # Configuration des rankings
+        rankings_config = {
+            # MATCH
+            "Nombre total de matches tirés": {'col': 'Nb matchs', 'titre': 'Plus grand nombre de matches tirés', 'type': 'simple'},
+            "Nombre de matches en poule": {'col': 'Nb matchs poule', 'titre': 'Plus grand nombre de matches en poule', 'type': 'simple'},
+            "Nombre de matches de tableau": {'col': 'Nb matchs tableau', 'titre': 'Plus grand nombre de matches de tableau', 'type': 'simple'},
+            # VICTOIRES
+            "% total de victoires": {'col': 'Pct victoires total', 'titre': 'Meilleur % total de victoires', 'type': 'pourcentage'},
+            "% de victoires en poules": {'col': 'Pct victoires poules', 'titre': 'Meilleur % de victoires en poules', 'type': 'pourcentage'},
+            "% de victoires dans le tableau": {'col': 'Pct victoires tableau', 'titre': 'Meilleur % de victoires dans le tableau', 'type': 'pourcentage'},
+            "Nombre de victoires": {'col': 'Nb victoires', 'titre': 'Plus grand nombre de victoires', 'type': 'simple'},
+            "Nombre de victoires serrées": {'col': 'Nb vict serrees', 'titre': 'Plus grand nombre de victoires serrées', 'type': 'empile', 'col1': 'Vict 5-4', 'col2': 'Vict 10-9', 'label1': 'Victoires 5-4', 'label2': 'Victoires 10-9'},
+            "Nombre de défaites serrées": {'col': 'Nb def serrees', 'titre': 'Plus grand nombre de défaites serrées', 'type': 'empile', 'col1': 'Def 4-5', 'col2': 'Def 9-10', 'label1': 'Défaites 4-5', 'label2': 'Défaites 9-10'},
+            "Nerf d'acier": {'col': 'Nerf acier', 'titre': 'Nerf d\'acier (victoires 10-9)', 'type': 'simple'},
+            # TOUCHES
+            "Nombre total de touches marquées": {'col': 'Total touches marquees', 'titre': 'Plus grand nombre de touches marquées', 'type': 'empile_touches', 'col1': 'Touches marquees poule', 'col2': 'Touches marquees tableau'},
+            "Nombre moyen de touches marquées par compétition": {'col': 'Moy touches par compet', 'titre': 'Meilleure moyenne de touches marquées par compétition', 'type': 'decimal'},
+            "Nombre de touches reçues": {'col': 'Total touches recues', 'titre': 'Plus grand nombre de touches reçues', 'type': 'simple'},
+            "Nombre moyen de touches reçues par compétition": {'col': 'Moy touches recues par compet', 'titre': 'Moyenne de touches reçues par compétition', 'type': 'decimal'},
+            # POULE
+            "Nombre de touches marquées en poule": {'col': 'Touches marquees poule', 'titre': 'Plus grand nombre de touches marquées en poule', 'type': 'simple'},
+            "Nombre de touches reçues en poule": {'col': 'Touches recues poule', 'titre': 'Plus grand nombre de touches reçues en poule', 'type': 'simple'},
+            "Nombre de touches marquées en moyenne par match de poule": {'col': 'Moy touches marquees par match poule', 'titre': 'Meilleure moyenne de touches marquées par match de poule', 'type': 'decimal'},
+            "Nombre de touches reçues en moyenne par match de poule": {'col': 'Moy touches recues par match poule', 'titre': 'Moyenne de touches reçues par match de poule', 'type': 'decimal'},
+            "Nombre de matchs à 5-4": {'col': 'Nb matchs 5-4', 'titre': 'Plus grand nombre de matchs à 5-4', 'type': 'simple'},
+            # TABLEAU
+            "Nombre de touches marquées dans le tableau": {'col': 'Touches marquees tableau', 'titre': 'Plus grand nombre de touches marquées dans le tableau', 'type': 'simple'},
+            "Nombre de touches reçues dans le tableau": {'col': 'Touches recues tableau', 'titre': 'Plus grand nombre de touches reçues dans le tableau', 'type': 'simple'},
+            "Nombre de touches marquées en moy. par match de tableau": {'col': 'Moy touches marquees par match tableau', 'titre': 'Meilleure moyenne de touches marquées par match de tableau', 'type': 'decimal'},
+            "Nombre de touches reçues en moy. par match de tableau": {'col': 'Moy touches recues par match tableau', 'titre': 'Moyenne de touches reçues par match de tableau', 'type': 'decimal'},
+            "Nombre de matchs à 10-9": {'col': 'Nb matchs 10-9', 'titre': 'Plus grand nombre de matchs à 10-9', 'type': 'simple'},
+            # COMPETITIONS
+            "Nombre de compétitions gagnées": {'col': 'Nb compet gagnees', 'titre': 'Plus grand nombre de compétitions gagnées', 'type': 'simple'},
+            "Nombre de podiums": {'col': 'Nb podiums', 'titre': 'Plus grand nombre de podiums', 'type': 'simple'},
+            "Nombre de participations": {'col': 'Nb participations', 'titre': 'Plus grand nombre de participations', 'type': 'simple'}
+        }
+        
+        config = rankings_config[ranking_choisi]
+        
+        # Classement lu dans la matrice des rangs (égalités départagées par ordre alphabétique)
+        df_stats = df_stats_complet.iloc[ordre_classement(rangs, config['col'])]
+        
+        # Trouver la position de l'escrimeur sélectionné
+        position_escrimeur = None
+        valeur_escrimeur = None
+        if escrimeur_selectionne and escrimeur_selectionne in rangs.index:
+            position_escrimeur = int(rangs.at[escrimeur_selectionne, config['col']])
+            valeur_escrimeur = df_stats.iloc[position_escrimeur - 1][config['col']]
+        
+                    # Podium
+        with st.container(border=True):
+            st.markdown(f"<h3 style='text-align: center;'>{config['titre']}</h3>", unsafe_allow_html=True)
+            st.markdown("")
+            
+            # Si un escrimeur est sélectionné, toujours afficher sa colonne
+            if position_escrimeur:
+                col1, col2, col3, col_sep, col_esc = st.columns([1, 1, 1, 0.2, 1])
+            else:
+                col1, col2, col3 = st.columns(3)
+                col_esc = None
+            
+            with col1:
+                if len(df_stats) >= 2:
+                    deuxieme = df_stats.iloc[1]
+                    if config['type'] == 'pourcentage':
+                        valeur = f"{deuxieme[config['col']]:.1f}%"
+                    elif config['type'] == 'decimal':
+                        valeur = f"{deuxieme[config['col']]:.1f}"
+                    else:
+                        valeur = str(int(deuxieme[config['col']]))
+                    st.markdown(f"<h1 style='text-align: center;'>🥈</h1>", unsafe_allow_html=True)
+                    st.markdown(f"<h2 style='text-align: center;'>{valeur}</h2>", unsafe_allow_html=True)
+                    st.markdown(f"<p style='text-align: center; font-size: 18px;'>{deuxieme['Tireur']}</p>", unsafe_allow_html=True)
+            
+            with col2:
+                if len(df_stats) >= 1:
+                    premier = df_stats.iloc[0]
+                    if config['type'] == 'pourcentage':
+                        valeur = f"{premier[config['col']]:.1f}%"
+                    elif config['type'] == 'decimal':
+                        valeur = f"{premier[config['col']]:.1f}"
+                    else:
+                        valeur = str(int(premier[config['col']]))
+                    st.markdown(f"<h1 style='text-align: center;'>🥇</h1>", unsafe_allow_html=True)
+                    st.markdown(f"<h2 style='text-align: center;'>{valeur}</h2>", unsafe_allow_html=True)
+                    st.markdown(f"<p style='text-align: center; font-size: 18px;'>{premier['Tireur']}</p>", unsafe_allow_html=True)
+            
+            with col3:
+                if len(df_stats) >= 3:
+                    troisieme = df_stats.iloc[2]
+                    if config['type'] == 'pourcentage':
+                        valeur = f"{troisieme[config['col']]:.1f}%"
+                    elif config['type'] == 'decimal':
+                        valeur = f"{troisieme[config['col']]:.1f}"
+                    else:
+                        valeur = str(int(troisieme[config['col']]))
+                    st.markdown(f"<h1 style='text-align: center;'>🥉</h1>", unsafe_allow_html=True)
+                    st.markdown(f"<h2 style='text-align: center;'>{valeur}</h2>", unsafe_allow_html=True)
+                    st.markdown(f"<p style='text-align: center; font-size: 18px;'>{troisieme['Tireur']}</p>", unsafe_allow_html=True)
+            
+            if col_esc:
+                with col_esc:
+                    if config['type'] == 'pourcentage':
+                        valeur = f"{valeur_escrimeur:.1f}%"
+                    elif config['type'] == 'decimal':
+                        valeur = f"{valeur_escrimeur:.1f}"
+                    else:
+                        valeur = str(int(valeur_escrimeur))
+                    st.markdown(f"<h1 style='text-align: center;'>#{position_escrimeur}</h1>", unsafe_allow_html=True)
+                    st.markdown(f"<h2 style='text-align: center;'>{valeur}</h2>", unsafe_allow_html=True)
+                    st.markdown(f"<p style='text-align: center; font-size: 18px;'>{escrimeur_selectionne}</p>", unsafe_allow_html=True)
+        
+        # Histogramme
+        st.markdown("")
+        
+        with st.container(border=True):
+            if config['type'] == 'empile_touches':
+                fig = go.Figure()
+                couleurs_5 = ['#FF0000' if tireur == escrimeur_selectionne else '#9370DB' for tireur in df_stats['Tireur']]
+                couleurs_10 = ['#FF0000' if tireur == escrimeur_selectionne else '#4169E1' for tireur in df_stats['Tireur']]
+                
+                fig.add_trace(go.Bar(
+                    y=df_stats['Tireur'],
+                    x=df_stats[config['col1']],
+                    name='Matchs en 5 touches',
+                    orientation='h',
+                    marker_color=couleurs_5,
+                    text=df_stats[config['col']],
+                    textposition='outside',
+                    textfont=dict(size=12)
+                ))
+                
+                fig.add_trace(go.Bar(
+                    y=df_stats['Tireur'],
+                    x=df_stats[config['col2']],
+                    name='Matchs en 10 touches',
+                    orientation='h',
+                    marker_color=couleurs_10
+                ))
+                
+                fig.update_layout(
+                    barmode='stack',
+                    height=max(400, len(df_stats) * 25),
+                    xaxis_title="Nombre de touches",
+                    yaxis_title="",
+                    showlegend=True,
+                    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+                    yaxis=dict(autorange='reversed')
+                )
+            elif config['type'] == 'empile':
+                fig = go.Figure()
+                couleurs_1 = ['#FF0000' if tireur == escrimeur_selectionne else '#9370DB' for tireur in df_stats['Tireur']]
+                couleurs_2 = ['#FF0000' if tireur == escrimeur_selectionne else '#4169E1' for tireur in df_stats['Tireur']]
+                
+                fig.add_trace(go.Bar(
+                    y=df_stats['Tireur'],
+                    x=df_stats[config['col1']],
+                    name=config['label1'],
+                    orientation='h',
+                    marker_color=couleurs_1,
+                    text=df_stats[config['col']],
+                    textposition='outside',
+                    textfont=dict(size=12)
+                ))
+                
+                fig.add_trace(go.Bar(
+                    y=df_stats['Tireur'],
+                    x=df_stats[config['col2']],
+                    name=config['label2'],
+                    orientation='h',
+                    marker_color=couleurs_2
+                ))
+                
+                fig.update_layout(
+                    barmode='stack',
+                    height=max(400, len(df_stats) * 25),
+                    xaxis_title="Nombre",
+                    yaxis_title="",
+                    showlegend=True,
+                    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+                    yaxis=dict(autorange='reversed')
+                )
+            else:
+                fig = go.Figure()
+                couleurs = ['#FF0000' if tireur == escrimeur_selectionne else '#4169E1' for tireur in df_stats['Tireur']]
+                
+                if config['type'] == 'pourcentage':
+                    text_vals = df_stats[config['col']].apply(lambda x: f"{x:.1f}%")
+                elif config['type'] == 'decimal':
+                    text_vals = df_stats[config['col']].apply(lambda x: f"{x:.1f}")
+                else:
+                    text_vals = df_stats[config['col']].apply(lambda x: str(int(x)))
+                
+                fig.add_trace(go.Bar(
+                    y=df_stats['Tireur'],
+                    x=df_stats[config['col']],
+                    orientation='h',
+                    marker_color=couleurs,
+                    text=text_vals,
+                    textposition='outside'
+                ))
+                
+                fig.update_layout(
+                    height=max(400, len(df_stats) * 25),
+                    xaxis_title="",
+                    yaxis_title="",
+                    showlegend=False,
+                    yaxis=dict(autorange='reversed')
+                )
+            
+            st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("👆 Sélectionnez une statistique dans les onglets ci-dessus pour afficher le classement.")
+
+
+if len(df_stats_complet) > 0:
+    classement_rankings(
+        df_stats_complet,
+        rangs_rankings(version_donnees, saison_min_rank, saison_max_rank),
+        escrimeur_selectionne
+    )
+else:
+    st.info("Aucun tireur n'a fait au moins 10 matchs sur cette période.")
@@ -0,0 +1,246 @@
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from annuaire import charger_annuaire_classements, selecteur_tireur
+from classements import (CLE_COMPETITION, bilan_medailles, charger_lignes_tireurs, charger_medailles,
+                         charger_tailles_competitions, classement_medailles, historique_resultats)
+from donnees import charger_donnees, version_classeur
+
+version_donnees = version_classeur()
+df_class = charger_donnees(version_donnees)[1]
+lignes_tireurs = charger_lignes_tireurs(version_donnees)
+medailles_tous = charger_medailles(version_donnees)
+annuaire_classements = charger_annuaire_classements(version_donnees)
+
+# ===== PAGE : RÉSULTATS =====
+st.title("🏆 Résultats")
+
+# Filtres en haut
+col1, col2 = st.columns([2, 1])
+
+with col1:
+    # Utiliser l'escrimeur principal comme défaut
+    escrimeur_defaut_res = st.session_state.get('escrimeur_principal', 'TURLIER Christophe')
+    if escrimeur_defaut_res not in annuaire_classements:
+        escrimeur_defaut_res = annuaire_classements.noms[0]
+    
+    escrimeur_res = selecteur_tireur("Sélectionner un escrimeur", annuaire_classements, escrimeur_defaut_res, key="escrimeur_resultats")
+
+with col2:
+    # Filtre saisons
+    saisons_class = sorted([s for s in df_class['Saison'].unique() if s != 2021])
+    saison_min_res, saison_max_res = st.select_slider(
+        "Plage de saisons",
+        options=saisons_class,
+        value=(min(saisons_class), max(saisons_class)),
+        key="saisons_resultats"
+    )
+
+# Filtrer les données pour l'escrimeur (lignes lues dans l'index) et les saisons
+df_class_tireur = df_class.iloc[lignes_tireurs[escrimeur_res]]
+df_class_filtre = df_class_tireur[
+    (df_class_tireur['Saison'] >= saison_min_res) &
+    (df_class_tireur['Saison'] <= saison_max_res)
+].copy()
+
+# Statistiques lues dans la table des médailles (sommes sur la plage de saisons)
+bilan, bilan_par_type = bilan_medailles(medailles_tous, escrimeur_res, saison_min_res, saison_max_res)
+total_competitions = int(bilan['competitions'])
+medailles = int(bilan['medailles'])
+pct_medailles = (medailles / total_competitions * 100) if total_competitions > 0 else 0
+
+# Statistiques par tour
+finales = int(bilan['finales'])
+demi_finales = int(bilan['demi_finales'])
+quarts = int(bilan['quarts'])
+tableau_16 = int(bilan['tableau_16'])
+tableau_32 = int(bilan['tableau_32'])
+
+# Afficher le résumé
+st.markdown("---")
+
+col_gauche, col_droite = st.columns(2)
+
+with col_gauche:
+    with st.container(border=True, height=650):  # HAUTEUR FIXE EN PIXELS
+        # Phrase sur 2 lignes pour éviter les problèmes d'alignement
+        st.markdown(f"<p style='font-size: 21px; text-align: center;'><b>{escrimeur_res} est médaillé dans {pct_medailles:.0f}% des {total_competitions} compétitions<br>auxquelles il a participé</b></p>", unsafe_allow_html=True)
+        
+        st.markdown("<br><br>", unsafe_allow_html=True)
+        
+        # Statistiques CN
+        st.markdown("<p style='font-size: 21px; text-align: center;'><b>Circuits Nationaux</b></p>", unsafe_allow_html=True)
+        bilan_cn = bilan_par_type.loc['CN']
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            premiers_cn = int(bilan_cn['premiers'])
+            st.markdown(f"<p style='font-size: 19px; text-align: center;'>🥇 1er</p>", unsafe_allow_html=True)
+            st.markdown(f"<p style='font-size: 27px; text-align: center; font-weight: bold;'>{premiers_cn}</p>", unsafe_allow_html=True)
+        with col2:
+            seconds_cn = int(bilan_cn['seconds'])
+            st.markdown(f"<p style='font-size: 19px; text-align: center;'>🥈 2ème</p>", unsafe_allow_html=True)
+            st.markdown(f"<p style='font-size: 27px; text-align: center; font-weight: bold;'>{seconds_cn}</p>", unsafe_allow_html=True)
+        with col3:
+            troisiemes_cn = int(bilan_cn['troisiemes'])
+            st.markdown(f"<p style='font-size: 19px; text-align: center;'>🥉 3ème</p>", unsafe_allow_html=True)
+            st.markdown(f"<p style='font-size: 27px; text-align: center; font-weight: bold;'>{troisiemes_cn}</p>", unsafe_allow_html=True)
+        
+        st.markdown("<br><br>", unsafe_allow_html=True)
+        
+        # Statistiques CdF
+        st.markdown("<p style='font-size: 21px; text-align: center;'><b>Championnats de France</b></p>", unsafe_allow_html=True)
+        bilan_cdf = bilan_par_type.loc['CdF']
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            premiers_cdf = int(bilan_cdf['premiers'])
+            st.markdown(f"<p style='font-size: 19px; text-align: center;'>🥇 1er</p>", unsafe_allow_html=True)
+            st.markdown(f"<p style='font-size: 27px; text-align: center; font-weight: bold;'>{premiers_cdf}</p>", unsafe_allow_html=True)
+        with col2:
+            seconds_cdf = int(bilan_cdf['seconds'])
+            st.markdown(f"<p style='font-size: 19px; text-align: center;'>🥈 2ème</p>", unsafe_allow_html=True)
+            st.markdown(f"<p style='font-size: 27px; text-align: center; font-weight: bold;'>{seconds_cdf}</p>", unsafe_allow_html=True)
+        with col3:
+            troisiemes_cdf = int(bilan_cdf['troisiemes'])
+            st.markdown(f"<p style='font-size: 19px; text-align: center;'>🥉 3ème</p>", unsafe_allow_html=True)
+            st.markdown(f"<p style='font-size: 27px; text-align: center; font-weight: bold;'>{troisiemes_cdf}</p>", unsafe_allow_html=True)
+
+with col_droite:
+    with st.container(border=True, height=650):  # MÊME HAUTEUR FIXE EN PIXELS
+        st.markdown(f"<p style='font-size: 21px; text-align: center;'><b>Participation à {total_competitions} compétitions</b></p>", unsafe_allow_html=True)
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        # Créer le camembert sans légende, avec labels intégrés, en excluant les valeurs à 0
+        if total_competitions > 0:
+            # Créer les données uniquement pour les valeurs > 0
+            data_camembert = []
+            labels_camembert = []
+            couleurs_camembert = []
+            
+            if finales > 0:
+                data_camembert.append(finales)
+                labels_camembert.append(f'Finale : {finales}')
+                couleurs_camembert.append('#FFD700')
+            
+            if demi_finales > 0:
+                data_camembert.append(demi_finales)
+                labels_camembert.append(f'Demi-Finale : {demi_finales}')
+                couleurs_camembert.append('#C0C0C0')
+            
+            if quarts > 0:
+                data_camembert.append(quarts)
+                labels_camembert.append(f'Quart de Finale : {quarts}')
+                couleurs_camembert.append('#CD7F32')
+            
+            if tableau_16 > 0:
+                data_camembert.append(tableau_16)
+                labels_camembert.append(f'Tableau de 16 : {tableau_16}')
+                couleurs_camembert.append('#3498db')
+            
+            if tableau_32 > 0:
+                data_camembert.append(tableau_32)
+                labels_camembert.append(f'Tableau de 32 : {tableau_32}')
+                couleurs_camembert.append('#95a5a6')
+            
+            fig_tours = go.Figure(data=[go.Pie(
+                labels=labels_camembert,
+                values=data_camembert,
+                hole=0.3,
+                marker_colors=couleurs_camembert,
+                textinfo='label',
+                textposition='outside',  # Forcer à l'extérieur
+                insidetextorientation='horizontal',
+                textfont=dict(size=19),  # Même taille que 1er, 2ème, 3ème
+                pull=[0 for _ in data_camembert]
+            )])
+            
+            fig_tours.update_layout(
+                showlegend=False,
+                height=450,  # Encore plus petit
+                width=450,   # Largeur réduite
+                margin=dict(t=20, b=20, l=20, r=20)
+            )
+            
+            st.plotly_chart(fig_tours, use_container_width=True)
+        else:
+            st.info("Aucune compétition sur cette période.")
+
+# Graphique avec toutes les compétitions (SANS ligne de séparation)
+
+with st.container(border=True):
+    st.subheader("Historique des résultats")
+    st.markdown("")
+    
+    # Places du tireur jointes sur le calendrier des compétitions (figure en cache)
+    fig_toutes = historique_resultats(version_donnees, escrimeur_res, saison_min_res, saison_max_res)
+    
+    if fig_toutes is not None:
+        st.plotly_chart(fig_toutes, use_container_width=True)
+    else:
+        st.info("Aucune compétition sur cette période.")
+
+# Tableau de tous les résultats (SANS ligne de séparation)
+
+col_tableau_resultats, col_medailles = st.columns([1, 1])  # Moitié de page
+
+with col_tableau_resultats:
+    with st.container(border=True):
+        st.subheader("Résultats")
+        st.markdown("")
+        
+        if len(df_class_filtre) > 0:
+            # Nombre total d'escrimeurs (= rang du dernier) joint depuis la table des tailles
+            tailles = charger_tailles_competitions(version_donnees)
+            lignes_resultats = df_class_filtre.merge(
+                tailles[['dernier_rang']], left_on=CLE_COMPETITION, right_index=True, how='left'
+            ).sort_values('Date', ascending=False)
+            total_escrimeurs = lignes_resultats['dernier_rang'].fillna(lignes_resultats['Rang']).astype(int)
+            
+            df_resultats = pd.DataFrame({
+                'Saison': lignes_resultats['Saison'].astype(str),  # Format string sans virgule
+                'Date': lignes_resultats['Date'].dt.strftime('%d/%m/%y'),
+                'Compétition': lignes_resultats['Compétition'],
+                'Catégorie': lignes_resultats['Catégorie'],
+                'Type': lignes_resultats['CN / CdF'],
+                'Résultat': lignes_resultats['Rang'].astype(str) + ' sur ' + total_escrimeurs.astype(str)
+            }).reset_index(drop=True)
+            
+            # Appliquer un style pour centrer la colonne Résultat
+            st.dataframe(df_resultats, use_container_width=True, hide_index=True, height=400)
+        else:
+            st.info("Aucun résultat sur cette période.")
+
+with col_medailles:
+    with st.container(border=True):
+        st.subheader("Tableau des médailles")
+        st.markdown("")
+        
+        # Tous les tireurs médaillés sur la plage de saisons, lus dans la table des médailles
+        classement = classement_medailles(medailles_tous, saison_min_res, saison_max_res)
+        
+        if len(classement) > 0:
+            df_medailles = pd.DataFrame({
+                'Rang': range(1, len(classement) + 1),
+                'Tireur': classement.index,
+                '🥇': classement['premiers'].to_numpy(),
+                '🥈': classement['seconds'].to_numpy(),
+                '🥉': classement['troisiemes'].to_numpy(),
+                'Médailles': classement['medailles'].to_numpy(),
+                'Compétitions': classement['competitions'].to_numpy()
+            })
+            
+            # Mettre en évidence l'escrimeur sélectionné
+            st.dataframe(
+                df_medailles.style.apply(
+                    lambda ligne: ['background-color: rgba(231, 76, 60, 0.2)' if ligne['Tireur'] == escrimeur_res else '' for _ in ligne],
+                    axis=1
+                ),
+                use_container_width=True,
+                hide_index=True,
+                height=400
+            )
+        else:
+            st.info("Aucune médaille sur cette période.")
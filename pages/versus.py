@@ -0,0 +1,418 @@
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from annuaire import charger_annuaire, selecteur_tireur
+from donnees import charger_donnees, charger_index_tireurs, version_classeur
+from statistiques import charger_confrontations
+
+version_donnees = version_classeur()
+df = charger_donnees(version_donnees)[0]
+index_tireurs = charger_index_tireurs(version_donnees)
+annuaire = charger_annuaire(version_donnees)
+
+# ===== PAGE : VERSUS =====
+st.title("⚔️ Versus")
+
+# Récupérer tous les tireurs
+tireurs_versus = annuaire.noms
+
+# Filtres en haut - Sélection des escrimeurs avec image VS
+with st.container(border=True):
+    col1, col2, col3 = st.columns([2, 1, 2])
+    
+    with col1:
+        # Escrimeur 1 - utiliser l'escrimeur principal par défaut
+        escrimeur1_defaut = st.session_state.get('escrimeur_principal', 'TURLIER Christophe')
+        if escrimeur1_defaut not in annuaire:
+            escrimeur1_defaut = tireurs_versus[0]
+        escrimeur1 = selecteur_tireur("Sélectionner Escrimeur 1", annuaire, escrimeur1_defaut, key="esc1")
+    
+    with col2:
+        # Image VS
+        try:
+            from PIL import Image
+            import base64
+            from io import BytesIO
+            vs_image = Image.open('/mnt/user-data/uploads/1770818459684_image.png')
+            st.image(vs_image, use_column_width=True)
+        except:
+            st.markdown("<h1 style='text-align: center;'>VS</h1>", unsafe_allow_html=True)
+    
+    with col3:
+        # Escrimeur 2
+        escrimeur2_defaut = tireurs_versus[1] if len(tireurs_versus) > 1 else tireurs_versus[0]
+        escrimeur2 = selecteur_tireur("Sélectionner Escrimeur 2", annuaire, escrimeur2_defaut, key="esc2")
+    
+    # Slider saisons
+    st.markdown("")
+    saisons_versus = sorted([s for s in df['Saison'].unique() if s != 2021])
+    saison_min_vs, saison_max_vs = st.select_slider(
+        "Plage de saisons",
+        options=saisons_versus,
+        value=(min(saisons_versus), max(saisons_versus)),
+        key="saisons_versus"
+    )
+
+# Compteurs de la paire, vus par chaque escrimeur (lecture directe, sans parcourir les matchs)
+confrontations = charger_confrontations(version_donnees)
+compteurs_esc1 = confrontations.sommes(escrimeur1, escrimeur2, saison_min_vs, saison_max_vs)
+compteurs_esc2 = confrontations.sommes(escrimeur2, escrimeur1, saison_min_vs, saison_max_vs)
+
+# Calculer les statistiques
+total_confrontations = compteurs_esc1['total']
+
+if total_confrontations > 0:
+    # Matchs (ordre de la base) avec les touches vues par l'escrimeur 1, pour le détail
+    vue_esc1 = index_tireurs.vue(escrimeur1)
+    vue_esc1 = vue_esc1[
+        (vue_esc1['Adversaire'] == escrimeur2) &
+        (vue_esc1['Saison'] >= saison_min_vs) &
+        (vue_esc1['Saison'] <= saison_max_vs)
+    ]
+    df_versus = df.iloc[vue_esc1['Ligne']].copy()
+    df_versus['Touches Marquées'] = vue_esc1['Touches Marquées'].to_numpy()
+    df_versus['Touches Reçues'] = vue_esc1['Touches Reçues'].to_numpy()
+    
+    # Victoires escrimeur 1
+    victoires_esc1 = compteurs_esc1['victoires']
+    victoires_esc2 = compteurs_esc2['victoires']
+    pct_victoires_esc1 = (victoires_esc1 / total_confrontations * 100)
+    
+    # Couleurs distinctives
+    couleur_esc1 = '#3498db'  # Bleu
+    couleur_esc2 = '#e74c3c'  # Rouge
+    
+    # BLOC 1 : Pourcentage et histogramme uniquement
+    with st.container(border=True):
+        st.markdown(f"<p style='font-size: 20px; text-align: center;'><b><span style='color:{couleur_esc1}'>{pct_victoires_esc1:.0f}%</span> de victoires pour <span style='color:{couleur_esc1}'>{escrimeur1}</span></b></p>", unsafe_allow_html=True)
+        
+        st.markdown("")
+        
+        # Histogramme HORIZONTAL des confrontations
+        fig_confrontations = go.Figure()
+        
+        fig_confrontations.add_trace(go.Bar(
+            y=['Confrontations'],
+            x=[victoires_esc1],
+            name=escrimeur1,
+            marker_color=couleur_esc1,
+            text=victoires_esc1,
+            textposition='inside',
+            textfont=dict(size=20, color='white'),
+            showlegend=False,
+            orientation='h'
+        ))
+        
+        fig_confrontations.add_trace(go.Bar(
+            y=['Confrontations'],
+            x=[victoires_esc2],
+            name=escrimeur2,
+            marker_color=couleur_esc2,
+            text=victoires_esc2,
+            textposition='inside',
+            textfont=dict(size=20, color='white'),
+            showlegend=False,
+            orientation='h'
+        ))
+        
+        fig_confrontations.update_layout(
+            barmode='stack',
+            height=100,
+            showlegend=False,
+            xaxis=dict(visible=False, range=[0, total_confrontations * 1.2]),
+            yaxis=dict(visible=False),
+            margin=dict(t=0, b=0, l=100, r=100),
+            bargap=0.3
+        )
+        
+        # Centrer l'histogramme
+        col_vide1, col_histo, col_vide2 = st.columns([0.5, 2, 0.5])
+        with col_histo:
+            st.plotly_chart(fig_confrontations, use_container_width=True)
+    
+    # BLOC 2 et 3 : Stats à gauche (moitié page), Camemberts à droite (moitié page)
+    st.markdown("")
+    
+    col_stats_gauche, col_camemberts_droite = st.columns([1, 1])
+    
+    # Calculer les stats par type
+    nb_poules_vs = compteurs_esc1['poules']
+    nb_tableaux_vs = compteurs_esc1['tableaux']
+    
+    vict_poules_esc1 = compteurs_esc1['vict_poules']
+    vict_tableaux_esc1 = compteurs_esc1['vict_tableaux']
+    
+    pct_poules_esc1 = (vict_poules_esc1 / nb_poules_vs * 100) if nb_poules_vs > 0 else 0
+    pct_tableaux_esc1 = (vict_tableaux_esc1 / nb_tableaux_vs * 100) if nb_tableaux_vs > 0 else 0
+    
+    # Touches marquées
+    touches_esc1 = compteurs_esc1['tm']
+    touches_esc2 = compteurs_esc1['tr']
+    
+    # Score moyen quand chacun gagne - UNIQUEMENT MATCHS EN 10 TOUCHES (TABLEAUX)
+    gagne_esc1 = compteurs_esc1['vict_tableaux']
+    gagne_esc2 = compteurs_esc2['vict_tableaux']
+    
+    score_moy_perdant_esc2 = compteurs_esc1['tr_vict_tableaux'] / gagne_esc1 if gagne_esc1 > 0 else 0
+    score_moy_perdant_esc1 = compteurs_esc2['tr_vict_tableaux'] / gagne_esc2 if gagne_esc2 > 0 else 0
+    
+    # BLOC 2 : Statistiques détaillées (gauche)
+    with col_stats_gauche:
+        with st.container(border=True):
+            st.markdown("### Statistiques détaillées")
+            st.markdown("")
+            
+            matchs_10_touches = nb_tableaux_vs
+            
+            st.markdown(f"<p style='font-size:16px;'><b>{total_confrontations} confrontations, dont {matchs_10_touches} matchs en 10 touches</b></p>", unsafe_allow_html=True)
+            st.markdown(f"<p style='color:{couleur_esc1}; font-size:16px;'><b>{pct_poules_esc1:.1f}% de victoires en poules pour {escrimeur1}</b></p>", unsafe_allow_html=True)
+            st.markdown(f"<p style='color:{couleur_esc1}; font-size:16px;'><b>{pct_tableaux_esc1:.1f}% de victoires en tableau pour {escrimeur1}</b></p>", unsafe_allow_html=True)
+            st.markdown(f"<p style='color:{couleur_esc1}; font-size:16px;'><b>{touches_esc1} touches marquées par {escrimeur1}</b></p>", unsafe_allow_html=True)
+            st.markdown(f"<p style='color:{couleur_esc2}; font-size:16px;'><b>{touches_esc2} touches marquées par {escrimeur2}</b></p>", unsafe_allow_html=True)
+            
+            # Afficher les scores moyens avec gestion du "-"
+            if gagne_esc1 > 0:
+                st.markdown(f"<p style='color:{couleur_esc1}; font-size:16px;'><b>Score moyen quand {escrimeur1} gagne : 10 - {score_moy_perdant_esc2:.1f}</b></p>", unsafe_allow_html=True)
+            else:
+                st.markdown(f"<p style='color:{couleur_esc1}; font-size:16px;'><b>Score moyen quand {escrimeur1} gagne : -</b></p>", unsafe_allow_html=True)
+            
+            if gagne_esc2 > 0:
+                st.markdown(f"<p style='color:{couleur_esc2}; font-size:16px;'><b>Score moyen quand {escrimeur2} gagne : 10 - {score_moy_perdant_esc1:.1f}</b></p>", unsafe_allow_html=True)
+            else:
+                st.markdown(f"<p style='color:{couleur_esc2}; font-size:16px;'><b>Score moyen quand {escrimeur2} gagne : -</b></p>", unsafe_allow_html=True)
+    
+    # BLOC 3 : Camemberts côte à côte (droite)
+    with col_camemberts_droite:
+        with st.container(border=True):
+            st.markdown("### Matchs")
+            st.markdown("")
+            
+            col_cam1, col_cam2 = st.columns(2)
+            
+            with col_cam1:
+                # Camembert 1 : Matchs en 5 touches
+                vict_5t_esc1 = compteurs_esc1['vict_poules']
+                vict_5t_esc2 = compteurs_esc2['vict_poules']
+                
+                fig_5t = go.Figure(data=[go.Pie(
+                    labels=[escrimeur1, escrimeur2],
+                    values=[vict_5t_esc1, vict_5t_esc2],
+                    marker_colors=[couleur_esc1, couleur_esc2],
+                    textinfo='value',
+                    textfont=dict(size=18),
+                    hole=0
+                )])
+                fig_5t.update_layout(
+                    title=dict(text="Matchs 5 touches", font=dict(size=18), x=0.5, xanchor='center'),
+                    height=200,
+                    margin=dict(t=40, b=0, l=0, r=0),
+                    showlegend=False
+                )
+                st.plotly_chart(fig_5t, use_container_width=True)
+            
+            with col_cam2:
+                # Camembert 2 : Matchs en 10 touches
+                vict_10t_esc1 = compteurs_esc1['vict_tableaux']
+                vict_10t_esc2 = compteurs_esc2['vict_tableaux']
+                
+                fig_10t = go.Figure(data=[go.Pie(
+                    labels=[escrimeur1, escrimeur2],
+                    values=[vict_10t_esc1, vict_10t_esc2],
+                    marker_colors=[couleur_esc1, couleur_esc2],
+                    textinfo='value',
+                    textfont=dict(size=18),
+                    hole=0
+                )])
+                fig_10t.update_layout(
+                    title=dict(text="Matchs 10 touches", font=dict(size=18), x=0.5, xanchor='center'),
+                    height=200,
+                    margin=dict(t=40, b=0, l=0, r=0),
+                    showlegend=False
+                )
+                st.plotly_chart(fig_10t, use_container_width=True)
+
+    
+    # Deux blocs côte à côte : Tableau et Histogramme
+    st.markdown("")
+    
+    col_tableau, col_histo = st.columns(2)
+    
+    with col_tableau:
+        with st.container(border=True):
+            st.subheader("15 derniers matchs")
+            
+            # Prendre les 15 derniers matchs
+            df_derniers = df_versus.sort_values('Date', ascending=False).head(15).copy()
+            
+            # Transformation Tour
+            transformation_tour = {
+                "Tableau de 32": "1/16e",
+                "Tableau de 16": "1/8e",
+                "Quart de finale": "1/4",
+                "Demi finale": "1/2",
+                "Finale": "F"
+            }
+            
+            # Créer le tableau
+            tableau_confrontations = []
+            for _, row in df_derniers.iterrows():
+                tour = row['Poule / Tableau']
+                if tour and not pd.isna(tour):
+                    if tour.startswith('Poule'):
+                        tour_affiche = tour
+                    else:
+                        tour_affiche = transformation_tour.get(tour, tour)
+                else:
+                    tour_affiche = ""
+                
+                # Score vu par l'escrimeur 1
+                score = f"{int(row['Touches Marquées'])} - {int(row['Touches Reçues'])}"
+                
+                tableau_confrontations.append({
+                    'Saison': int(row['Saison']),
+                    'Date': row['Date'].strftime('%d/%m/%y'),
+                    'Compétition': row['Compétition'],
+                    'Tour': tour_affiche,
+                    'Escrimeur 1': escrimeur1,
+                    'Score': score,
+                    'Escrimeur 2': escrimeur2,
+                    '_gagnant': row['Vainqueur']
+                })
+            
+            df_affichage_conf = pd.DataFrame(tableau_confrontations)
+            
+            # Supprimer la colonne _gagnant
+            gagnants_list = df_affichage_conf['_gagnant'].tolist()
+            df_affichage_final_conf = df_affichage_conf.drop(columns=['_gagnant'])
+            
+            # Créer une matrice de styles
+            styles_conf = pd.DataFrame('', index=df_affichage_final_conf.index, columns=df_affichage_final_conf.columns)
+            for idx in df_affichage_final_conf.index:
+                for col in df_affichage_final_conf.columns:
+                    if gagnants_list[idx] == escrimeur1:
+                        styles_conf.at[idx, col] = f'color: {couleur_esc1}'
+                    else:
+                        styles_conf.at[idx, col] = f'color: {couleur_esc2}'
+            
+            df_styled_conf = df_affichage_final_conf.style.apply(lambda x: styles_conf, axis=None)
+            
+            st.dataframe(df_styled_conf, use_container_width=True, hide_index=True, height=550)
+    
+    with col_histo:
+        with st.container(border=True):
+            st.subheader("Résultats des confrontations")
+            
+            # Créer l'histogramme horizontal
+            df_histo = df_versus.sort_values('Date').copy()
+            
+            touches_esc1_list = df_histo['Touches Marquées'].tolist()
+            touches_esc2_list = df_histo['Touches Reçues'].tolist()
+            
+            # Créer le graphique (jaune pour esc1 à gauche, orange pour esc2 à droite)
+            fig_touches = go.Figure()
+            
+            # Barres de gauche (escrimeur 1) - valeurs négatives pour aller à gauche
+            fig_touches.add_trace(go.Bar(
+                y=list(range(len(touches_esc1_list))),
+                x=[-t for t in touches_esc1_list],
+                orientation='h',
+                name=escrimeur1,
+                marker_color='#3498db',  # Bleu
+                text=touches_esc1_list,
+                textposition='inside',
+                textfont=dict(size=14),  # Agrandi
+                hoverinfo='text',
+                hovertext=[f"{escrimeur1}: {t}" for t in touches_esc1_list]
+            ))
+            
+            # Barres de droite (escrimeur 2)
+            fig_touches.add_trace(go.Bar(
+                y=list(range(len(touches_esc2_list))),
+                x=touches_esc2_list,
+                orientation='h',
+                name=escrimeur2,
+                marker_color='#e74c3c',  # Rouge
+                text=touches_esc2_list,
+                textposition='inside',
+                textfont=dict(size=14),  # Agrandi
+                hoverinfo='text',
+                hovertext=[f"{escrimeur2}: {t}" for t in touches_esc2_list]
+            ))
+            
+            fig_touches.update_layout(
+                barmode='overlay',
+                height=550,
+                showlegend=False,
+                xaxis=dict(
+                    range=[-15, 15],
+                    showticklabels=False,
+                    zeroline=True,
+                    zerolinecolor='black',
+                    zerolinewidth=2
+                ),
+                yaxis=dict(
+                    showticklabels=False,
+                    autorange='reversed'
+                ),
+                margin=dict(t=40, b=20, l=20, r=20),
+                annotations=[
+                    dict(
+                        text=f"<b>{escrimeur1}</b>",
+                        x=-10,
+                        y=-1,
+                        xref='x',
+                        yref='y',
+                        showarrow=False,
+                        font=dict(size=20, color='#3498db')  # Agrandi et gras
+                    ),
+                    dict(
+                        text=f"<b>{escrimeur2}</b>",
+                        x=10,
+                        y=-1,
+                        xref='x',
+                        yref='y',
+                        showarrow=False,
+                        font=dict(size=20, color='#e74c3c')  # Agrandi et gras
+                    )
+                ]
+            )
+            
+            st.plotly_chart(fig_touches, use_container_width=True)
+else:
+    st.info("Aucune confrontation entre ces deux escrimeurs sur cette période.")
+
+# Carte des confrontations entre les tireurs les plus actifs de la période
+st.markdown("")
+with st.expander("🗺️ Carte des confrontations"):
+    nb_tireurs_carte = st.slider("Nombre de tireurs", min_value=5, max_value=40, value=15, key="nb_tireurs_carte")
+    tireurs_carte = confrontations.plus_actifs(nb_tireurs_carte, saison_min_vs, saison_max_vs)
+    
+    if len(tireurs_carte) > 1:
+        totaux_carte, victoires_carte = confrontations.matrice(tireurs_carte, saison_min_vs, saison_max_vs)
+        pct_carte = (victoires_carte / totaux_carte.where(totaux_carte > 0) * 100).round(0)
+        textes_carte = victoires_carte.astype(str) + "/" + totaux_carte.astype(str)
+        textes_carte = textes_carte.where(totaux_carte > 0, "")
+        
+        fig_carte = go.Figure(data=go.Heatmap(
+            z=pct_carte.to_numpy(),
+            x=tireurs_carte,
+            y=tireurs_carte,
+            text=textes_carte.to_numpy(),
+            texttemplate="%{text}",
+            colorscale='RdBu',
+            zmin=0,
+            zmax=100,
+            colorbar=dict(title="% vict."),
+            hovertemplate="%{y} contre %{x}<br>%{text} victoires (%{z:.0f}%)<extra></extra>"
+        ))
+        fig_carte.update_layout(
+            height=max(400, len(tireurs_carte) * 28),
+            xaxis=dict(side='top', tickangle=-45),
+            yaxis=dict(autorange='reversed'),
+            margin=dict(t=120, b=20, l=20, r=20)
+        )
+        st.caption("Victoires du tireur en ligne contre le tireur en colonne")
+        st.plotly_chart(fig_carte, use_container_width=True)
+    else:
+        st.info("Pas assez de confrontations sur cette période.")
@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+# ===== MATRICE DES RANGS =====
+# Rangs de tous les tireurs pour plusieurs métriques à la fois : les valeurs
+# sont rangées dans une matrice tireur x métrique (métriques décroissantes
+# changées de signe pour que "meilleur" soit toujours "plus petit"), puis
+# un seul tri stable par colonne donne tous les rangs.
+# Départage des égalités : ordre alphabétique des tireurs. Une valeur
+# manquante est classée après toutes les autres.
+
+
+def matrice_rangs(df_stats, sens):
+    # df_stats : une ligne par tireur, indexée par le nom du tireur
+    # sens : {colonne: croissant ?} ; renvoie des rangs 1..n (int32)
+    colonnes = list(sens)
+    ordre_alpha = np.argsort(df_stats.index.astype(str).to_numpy(), kind='stable')
+
+    valeurs = df_stats[colonnes].to_numpy(dtype=np.float64)[ordre_alpha]
+    decroissantes = np.array([not sens[col] for col in colonnes])
+    valeurs[:, decroissantes] *= -1
+    valeurs[np.isnan(valeurs)] = np.inf
+
+    # Tri stable : à valeur égale, l'ordre alphabétique est conservé
+    positions = np.argsort(valeurs, axis=0, kind='stable')
+    rangs = np.empty(positions.shape, dtype=np.int32)
+    np.put_along_axis(rangs, positions, np.arange(1, len(valeurs) + 1, dtype=np.int32)[:, None], axis=0)
+
+    # Retour dans l'ordre des lignes de df_stats
+    rangs_lignes = np.empty_like(rangs)
+    rangs_lignes[ordre_alpha] = rangs
+    return pd.DataFrame(rangs_lignes, index=df_stats.index, columns=colonnes)
+
+
+def ordre_classement(rangs, colonne):
+    # Positions des lignes triées du 1er au dernier pour une métrique
+    positions = np.empty(len(rangs), dtype=np.int64)
+    positions[rangs[colonne].to_numpy() - 1] = np.arange(len(rangs))
+    return positions
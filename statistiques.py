@@ -0,0 +1,466 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from cache_lru import CacheLRU
+from donnees import charger_donnees, charger_perspective
+from rangs import matrice_rangs
+
+# ===== RANKINGS DE LA PAGE MATCHS =====
+# Statistiques de tous les tireurs lues dans le cube des saisons (une
+# soustraction de deux cumuls), puis les six rangs en une passe.
+
+# Nombre minimum de matchs pour être classé
+MIN_MATCHS_POULE = 5
+MIN_MATCHS_TABLEAU = 1
+
+# Colonne de statistique -> (colonne de rang, ordre croissant ?)
+RANGS_MATCHS = {
+    'total': ('rang_total', False),
+    'pct_victoires': ('rang_pct', False),
+    'touches_marquees_moy': ('rang_tm', False),
+    'touches_recues_moy': ('rang_tr', True),
+    'touches_recues_victoire': ('rang_trv', True),
+    'touches_marquees_defaite': ('rang_tmd', False)
+}
+
+
+# ===== CUBE DES SAISONS =====
+# Compteurs additifs par tireur x saison x phase, stockés en sommes cumulées
+# sur les saisons : l'agrégat d'une plage [saison_min, saison_max] est la
+# différence de deux lignes du cumul, sans relire la table des matchs.
+# Victoire / défaite = touches marquées > / < touches reçues ; la page
+# Rankings compte aussi les victoires selon la colonne Vainqueur ('gagnes'
+# et matchs serrés gagnés / perdus).
+COMPTEURS_MATCHS = [
+    'total', 'victoires', 'defaites', 'tm', 'tr',
+    'tm_victoire', 'tr_victoire', 'tm_defaite', 'tr_defaite',
+    'gagnes', 'vict_5_4', 'vict_10_9', 'def_4_5', 'def_9_10', 'matchs_5_4', 'matchs_10_9'
+]
+COMPTEURS_COMPETITIONS = ['participations', 'compet_gagnees', 'podiums']
+PHASES = {True: 0, False: 1}  # est_poule -> indice de phase
+
+
+def cumuler_saisons(cellule, valeurs, compteurs, forme):
+    # cube[..., compteur] puis cumul le long des saisons (axe 1), précédé d'une ligne de zéros
+    taille = int(np.prod(forme))
+    cube = np.stack([
+        np.bincount(cellule, weights=np.asarray(valeurs[c], dtype=np.float64), minlength=taille)
+        for c in compteurs
+    ], axis=-1).astype(np.int32).reshape(forme + (len(compteurs),))
+    cumul = np.zeros((forme[0], forme[1] + 1) + forme[2:] + (len(compteurs),), dtype=np.int32)
+    np.cumsum(cube, axis=1, out=cumul[:, 1:])
+    return cumul
+
+
+def plage_saisons(saisons, saison_min, saison_max):
+    # Lignes du cumul à soustraire pour la plage [saison_min, saison_max]
+    debut = np.searchsorted(saisons, saison_min, side='left')
+    fin = np.searchsorted(saisons, saison_max, side='right')
+    return debut, fin
+
+
+class CubeSaisons:
+    def __init__(self, perspective, df_class):
+        self.tireurs = perspective['Tireur'].cat.categories
+        self.saisons = np.sort(pd.unique(np.concatenate([
+            perspective['Saison'].to_numpy(dtype=np.int64),
+            df_class['Saison'].to_numpy(dtype=np.int64)
+        ])))
+        nb_tireurs, nb_saisons = len(self.tireurs), len(self.saisons)
+
+        # Compteurs des matchs (les lignes sans phase sont ignorées)
+        poules = perspective['Poule'].to_numpy()
+        avec_phase = poules | perspective['Tour'].notna().to_numpy()
+        vue = perspective[avec_phase]
+        phase = np.where(poules[avec_phase], PHASES[True], PHASES[False])
+        cellule = self._cellules(vue['Tireur'].cat.codes.to_numpy(), vue['Saison'].to_numpy())
+        cellule = cellule * len(PHASES) + phase
+
+        marquees = vue['Touches Marquées'].to_numpy(dtype=np.int64)
+        recues = vue['Touches Reçues'].to_numpy(dtype=np.int64)
+        victoire = marquees > recues
+        defaite = marquees < recues
+        gagne = vue['Victoire'].to_numpy()
+        score_5_4 = (marquees == 5) & (recues == 4)
+        score_4_5 = (marquees == 4) & (recues == 5)
+        score_10_9 = (marquees == 10) & (recues == 9)
+        score_9_10 = (marquees == 9) & (recues == 10)
+        valeurs = {
+            'total': np.ones(len(vue), dtype=np.int64),
+            'victoires': victoire,
+            'defaites': defaite,
+            'tm': marquees,
+            'tr': recues,
+            'tm_victoire': np.where(victoire, marquees, 0),
+            'tr_victoire': np.where(victoire, recues, 0),
+            'tm_defaite': np.where(defaite, marquees, 0),
+            'tr_defaite': np.where(defaite, recues, 0),
+            'gagnes': gagne,
+            'vict_5_4': gagne & score_5_4,
+            'vict_10_9': gagne & score_10_9,
+            'def_4_5': ~gagne & score_4_5,
+            'def_9_10': ~gagne & score_9_10,
+            'matchs_5_4': score_5_4 | score_4_5,
+            'matchs_10_9': score_10_9 | score_9_10
+        }
+        forme = (nb_tireurs, nb_saisons, len(PHASES))
+        self.matchs = cumuler_saisons(cellule, valeurs, COMPTEURS_MATCHS, forme)
+
+        # Compteurs des compétitions (tireurs présents dans la table des matchs)
+        codes = self.tireurs.get_indexer(df_class['Tireur'])
+        connus = codes >= 0
+        rangs = df_class['Rang'].to_numpy()[connus]
+        cellule = self._cellules(codes[connus], df_class['Saison'].to_numpy()[connus])
+        valeurs = {
+            'participations': np.ones(len(rangs), dtype=np.int64),
+            'compet_gagnees': rangs == 1,
+            'podiums': rangs <= 3
+        }
+        self.competitions = cumuler_saisons(cellule, valeurs, COMPTEURS_COMPETITIONS, (nb_tireurs, nb_saisons))
+
+    def _cellules(self, codes_tireurs, saisons):
+        return codes_tireurs.astype(np.int64) * len(self.saisons) + np.searchsorted(self.saisons, saisons)
+
+    def _plage(self, saison_min, saison_max):
+        return plage_saisons(self.saisons, saison_min, saison_max)
+
+    def sommes_phases(self, saison_min, saison_max):
+        # Compteurs de tous les tireurs sur la plage : tireur x phase x compteur
+        debut, fin = self._plage(saison_min, saison_max)
+        return self.matchs[:, fin] - self.matchs[:, debut]
+
+    def sommes_matchs(self, saison_min, saison_max, est_poule):
+        # Compteurs de chaque tireur ayant tiré dans la phase sur la plage
+        sommes = self.sommes_phases(saison_min, saison_max)[:, PHASES[est_poule]]
+        df_sommes = pd.DataFrame(sommes, columns=COMPTEURS_MATCHS, index=pd.Index(self.tireurs, name='Tireur'))
+        return df_sommes[df_sommes['total'] > 0]
+
+    def matchs_par_saison(self, tireur, saison_min, saison_max):
+        # Compteurs d'un tireur saison par saison (différences successives du
+        # cumul) : tableau saison x phase x compteur, et les saisons de la plage
+        debut, fin = self._plage(saison_min, saison_max)
+        code = self.tireurs.get_indexer([tireur])[0]
+        if code < 0:
+            return np.zeros((0, len(PHASES), len(COMPTEURS_MATCHS)), dtype=np.int32), self.saisons[:0]
+        return np.diff(self.matchs[code, debut:fin + 1], axis=0), self.saisons[debut:fin]
+
+    def sommes_competitions(self, saison_min, saison_max):
+        debut, fin = self._plage(saison_min, saison_max)
+        sommes = self.competitions[:, fin] - self.competitions[:, debut]
+        return pd.DataFrame(sommes, columns=COMPTEURS_COMPETITIONS, index=pd.Index(self.tireurs, name='Tireur'))
+
+
+def _moyenne(somme, nombre):
+    # Moyenne à 0 quand il n'y a aucun match
+    return (somme / nombre.where(nombre > 0)).fillna(0)
+
+
+def stats_matchs(cube, saison_min, saison_max, est_poule):
+    sommes = cube.sommes_matchs(saison_min, saison_max, est_poule)
+
+    return pd.DataFrame({
+        'total': sommes['total'],
+        'victoires': sommes['victoires'],
+        'defaites': sommes['defaites'],
+        'pct_victoires': sommes['victoires'] / sommes['total'] * 100,
+        'touches_marquees_moy': sommes['tm'] / sommes['total'],
+        'touches_recues_moy': sommes['tr'] / sommes['total'],
+        'touches_marquees_victoire': _moyenne(sommes['tm_victoire'], sommes['victoires']),
+        'touches_recues_victoire': _moyenne(sommes['tr_victoire'], sommes['victoires']),
+        'touches_marquees_defaite': _moyenne(sommes['tm_defaite'], sommes['defaites']),
+        'touches_recues_defaite': _moyenne(sommes['tr_defaite'], sommes['defaites'])
+    })
+
+
+def evolution_saisons(cube, tireur, saison_min, saison_max):
+    # Matchs, victoires et % de victoires du tireur par saison et par phase,
+    # limités aux saisons où il a tiré (% manquant si aucun match dans la phase)
+    par_saison, saisons = cube.matchs_par_saison(tireur, saison_min, saison_max)
+    total, victoires = COMPTEURS_MATCHS.index('total'), COMPTEURS_MATCHS.index('victoires')
+
+    evolution = pd.DataFrame(index=pd.Index(saisons, name='Saison'))
+    for nom_phase, est_poule in [('poules', True), ('tableaux', False)]:
+        matchs = par_saison[:, PHASES[est_poule], total]
+        gagnes = par_saison[:, PHASES[est_poule], victoires]
+        evolution[f'matchs_{nom_phase}'] = matchs
+        evolution[f'victoires_{nom_phase}'] = gagnes
+        evolution[f'pct_{nom_phase}'] = np.where(matchs > 0, gagnes / np.maximum(matchs, 1) * 100, np.nan)
+
+    return evolution[(evolution['matchs_poules'] + evolution['matchs_tableaux']) > 0]
+
+
+def classement_matchs(cube, saison_min, saison_max, est_poule):
+    # Stats de tous les tireurs ayant tiré dans la phase, avec leurs rangs
+    # parmi ceux qui atteignent le minimum de matchs (rang 0 sinon).
+    # À égalité, l'ordre alphabétique départage.
+    df_stats = stats_matchs(cube, saison_min, saison_max, est_poule)
+
+    min_matchs = MIN_MATCHS_POULE if est_poule else MIN_MATCHS_TABLEAU
+    classes = df_stats[df_stats['total'] >= min_matchs]
+
+    rangs = matrice_rangs(classes, {col: croissant for col, (_, croissant) in RANGS_MATCHS.items()})
+    rangs = rangs.reindex(df_stats.index, fill_value=0)
+    for col, (col_rang, _) in RANGS_MATCHS.items():
+        df_stats[col_rang] = rangs[col]
+
+    return df_stats
+
+
+# ===== RÉSUMÉ PAR TIREUR =====
+# Une ligne par tireur ayant au moins un match : matchs, victoires (colonne
+# Vainqueur), % de victoires, première et dernière saison, date du dernier
+# match. Sert à la barre latérale (escrimeur par défaut, stats rapides).
+def resume_tireurs(perspective):
+    resume = perspective.groupby('Tireur', observed=True).agg(
+        nb_matchs=('Ligne', 'size'),
+        victoires=('Victoire', 'sum'),
+        premiere_saison=('Saison', 'min'),
+        derniere_saison=('Saison', 'max'),
+        dernier_match=('Date', 'max')
+    )
+    resume['pct_victoires'] = resume['victoires'] / resume['nb_matchs'] * 100
+    resume.index = resume.index.astype(str)
+    return resume
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def charger_resume_tireurs(version):
+    return resume_tireurs(charger_perspective(version))
+
+
+# ===== CONFRONTATIONS DIRECTES =====
+# Compteurs par paire ordonnée (tireur, adversaire) x saison, stockés en
+# sommes cumulées comme le cube des saisons. Seules les paires qui se sont
+# rencontrées sont stockées ; le dictionnaire des paires donne la ligne
+# d'une paire en O(1), et une plage de saisons est une soustraction.
+# Victoire = colonne Vainqueur (comme sur la page Versus).
+COMPTEURS_CONFRONTATIONS = [
+    'total', 'victoires', 'tm', 'tr',
+    'poules', 'vict_poules', 'tableaux', 'vict_tableaux', 'tr_vict_tableaux'
+]
+
+
+class Confrontations:
+    def __init__(self, perspective):
+        self.tireurs = perspective['Tireur'].cat.categories
+        self.saisons = np.sort(perspective['Saison'].unique())
+        nb_tireurs = len(self.tireurs)
+
+        codes = perspective['Tireur'].cat.codes.to_numpy().astype(np.int64) * nb_tireurs + \
+            perspective['Adversaire'].cat.codes.to_numpy()
+        paires, ligne_paire = np.unique(codes, return_inverse=True)
+        self.codes_tireurs = paires // nb_tireurs
+        self.codes_adversaires = paires % nb_tireurs
+        self.paires = {
+            (self.tireurs[a], self.tireurs[b]): i
+            for i, (a, b) in enumerate(zip(self.codes_tireurs, self.codes_adversaires))
+        }
+
+        poule = perspective['Poule'].to_numpy()
+        tableau = ~poule & perspective['Tour'].notna().to_numpy()
+        victoire = perspective['Victoire'].to_numpy()
+        recues = perspective['Touches Reçues'].to_numpy(dtype=np.int64)
+        valeurs = {
+            'total': np.ones(len(perspective), dtype=np.int64),
+            'victoires': victoire,
+            'tm': perspective['Touches Marquées'].to_numpy(dtype=np.int64),
+            'tr': recues,
+            'poules': poule,
+            'vict_poules': poule & victoire,
+            'tableaux': tableau,
+            'vict_tableaux': tableau & victoire,
+            'tr_vict_tableaux': np.where(tableau & victoire, recues, 0)
+        }
+        cellule = ligne_paire.ravel() * len(self.saisons) + \
+            np.searchsorted(self.saisons, perspective['Saison'].to_numpy())
+        self.cumuls = cumuler_saisons(cellule, valeurs, COMPTEURS_CONFRONTATIONS, (len(paires), len(self.saisons)))
+
+    def _plage(self, saison_min, saison_max):
+        return plage_saisons(self.saisons, saison_min, saison_max)
+
+    def sommes(self, tireur, adversaire, saison_min, saison_max):
+        # Compteurs de la paire vus par le tireur (zéros si jamais rencontrés)
+        ligne = self.paires.get((tireur, adversaire))
+        if ligne is None:
+            return dict.fromkeys(COMPTEURS_CONFRONTATIONS, 0)
+        debut, fin = self._plage(saison_min, saison_max)
+        return dict(zip(COMPTEURS_CONFRONTATIONS, (self.cumuls[ligne, fin] - self.cumuls[ligne, debut]).tolist()))
+
+    def plus_actifs(self, nombre, saison_min, saison_max):
+        # Les tireurs ayant le plus de confrontations sur la plage
+        debut, fin = self._plage(saison_min, saison_max)
+        totaux = self.cumuls[:, fin, 0] - self.cumuls[:, debut, 0]
+        par_tireur = np.bincount(self.codes_tireurs, weights=totaux, minlength=len(self.tireurs))
+        codes = np.argsort(-par_tireur, kind='stable')[:nombre]
+        return list(self.tireurs[codes[par_tireur[codes] > 0]])
+
+    def matrice(self, tireurs, saison_min, saison_max):
+        # Confrontations et victoires de chaque tireur (ligne) contre chaque autre (colonne)
+        debut, fin = self._plage(saison_min, saison_max)
+        position = np.full(len(self.tireurs), -1)
+        position[self.tireurs.get_indexer(tireurs)] = np.arange(len(tireurs))
+        lignes = position[self.codes_tireurs]
+        colonnes = position[self.codes_adversaires]
+        gardees = (lignes >= 0) & (colonnes >= 0)
+
+        sommes = self.cumuls[gardees, fin] - self.cumuls[gardees, debut]
+        totaux = np.zeros((len(tireurs), len(tireurs)), dtype=np.int32)
+        victoires = np.zeros_like(totaux)
+        totaux[lignes[gardees], colonnes[gardees]] = sommes[:, COMPTEURS_CONFRONTATIONS.index('total')]
+        victoires[lignes[gardees], colonnes[gardees]] = sommes[:, COMPTEURS_CONFRONTATIONS.index('victoires')]
+
+        return (
+            pd.DataFrame(totaux, index=tireurs, columns=tireurs),
+            pd.DataFrame(victoires, index=tireurs, columns=tireurs)
+        )
+
+
+# ===== STATISTIQUES DE LA PAGE RANKINGS =====
+# Une trentaine de compteurs par tireur lus dans le cube des saisons (matchs
+# par phase et compétitions) : une plage de saisons est une soustraction de
+# deux cumuls, sans relire les matchs ni les classements.
+# Victoire = colonne Vainqueur ; tableau = phase renseignée hors poule (comme le cube).
+MIN_MATCHS_RANKINGS = 10
+
+
+def stats_rankings(cube, saison_min, saison_max):
+    index = pd.Index(cube.tireurs.astype(str), name='Tireur')
+    phases = cube.sommes_phases(saison_min, saison_max)
+    poules = pd.DataFrame(phases[:, PHASES[True]], columns=COMPTEURS_MATCHS, index=index)
+    totaux = poules + pd.DataFrame(phases[:, PHASES[False]], columns=COMPTEURS_MATCHS, index=index)
+    compets = cube.sommes_competitions(saison_min, saison_max).set_axis(index)
+
+    gardes = totaux['total'] >= MIN_MATCHS_RANKINGS
+    poules, totaux, compets = poules[gardes], totaux[gardes], compets[gardes]
+
+    sommes = pd.DataFrame({
+        'nb_matchs': totaux['total'],
+        'nb_poules': poules['total'],
+        'victoires': totaux['gagnes'],
+        'vict_poules': poules['gagnes'],
+        'vict_5_4': totaux['vict_5_4'],
+        'vict_10_9': totaux['vict_10_9'],
+        'def_4_5': totaux['def_4_5'],
+        'def_9_10': totaux['def_9_10'],
+        'touches_5_marquees': poules['tm'],
+        'touches_5_recues': poules['tr'],
+        'touches_marquees': totaux['tm'],
+        'touches_recues': totaux['tr'],
+        'matchs_5_4': totaux['matchs_5_4'],
+        'matchs_10_9': totaux['matchs_10_9'],
+        'participations': compets['participations'],
+        'compet_gagnees': compets['compet_gagnees'],
+        'podiums': compets['podiums']
+    })
+
+    nb_matchs = sommes['nb_matchs']
+    nb_poules = sommes['nb_poules']
+    nb_tableaux = nb_matchs - nb_poules
+    participations = sommes['participations'].astype('int64')
+    victoires = sommes['victoires']
+    vict_poules = sommes['vict_poules']
+    touches_5_marquees = sommes['touches_5_marquees']
+    touches_5_recues = sommes['touches_5_recues']
+    touches_10_marquees = sommes['touches_marquees'] - touches_5_marquees
+    touches_10_recues = sommes['touches_recues'] - touches_5_recues
+
+    df_stats = pd.DataFrame({
+        'Tireur': sommes.index,
+        # MATCH
+        'Nb matchs': nb_matchs,
+        'Nb matchs poule': nb_poules,
+        'Nb matchs tableau': nb_tableaux,
+        # VICTOIRES
+        'Pct victoires total': _moyenne(victoires, nb_matchs) * 100,
+        'Pct victoires poules': _moyenne(vict_poules, nb_poules) * 100,
+        'Pct victoires tableau': _moyenne(victoires - vict_poules, nb_tableaux) * 100,
+        'Nb victoires': victoires,
+        'Nb vict serrees': sommes['vict_5_4'] + sommes['vict_10_9'],
+        'Vict 5-4': sommes['vict_5_4'],
+        'Vict 10-9': sommes['vict_10_9'],
+        'Nb def serrees': sommes['def_4_5'] + sommes['def_9_10'],
+        'Def 4-5': sommes['def_4_5'],
+        'Def 9-10': sommes['def_9_10'],
+        'Nerf acier': sommes['vict_10_9'],
+        # TOUCHES
+        'Total touches marquees': sommes['touches_marquees'],
+        'Moy touches par compet': _moyenne(sommes['touches_marquees'], participations),
+        'Total touches recues': sommes['touches_recues'],
+        'Moy touches recues par compet': _moyenne(sommes['touches_recues'], participations),
+        # TOUCHES POULE
+        'Touches marquees poule': touches_5_marquees,
+        'Touches recues poule': touches_5_recues,
+        'Moy touches marquees par match poule': _moyenne(touches_5_marquees, nb_poules),
+        'Moy touches recues par match poule': _moyenne(touches_5_recues, nb_poules),
+        'Nb matchs 5-4': sommes['matchs_5_4'],
+        # TOUCHES TABLEAU
+        'Touches marquees tableau': touches_10_marquees,
+        'Touches recues tableau': touches_10_recues,
+        'Moy touches marquees par match tableau': _moyenne(touches_10_marquees, nb_tableaux),
+        'Moy touches recues par match tableau': _moyenne(touches_10_recues, nb_tableaux),
+        'Nb matchs 10-9': sommes['matchs_10_9'],
+        # COMPETITIONS
+        'Nb compet gagnees': sommes['compet_gagnees'].astype('int64'),
+        'Nb podiums': sommes['podiums'].astype('int64'),
+        'Nb participations': participations
+    })
+
+    return df_stats.reset_index(drop=True)
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def charger_cube(version):
+    df_class = charger_donnees(version)[1]
+    return CubeSaisons(charger_perspective(version), df_class)
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def charger_confrontations(version):
+    return Confrontations(charger_perspective(version))
+
+
+# ===== CACHE PARTAGÉ DES RANKINGS =====
+# Les tables de rankings ne dépendent que de la version des données, de la
+# plage de saisons et de la phase : elles sont calculées une fois pour toutes
+# les sessions du serveur.
+cache_rankings = CacheLRU(taille_max=64)
+
+
+def rankings_matchs(version, saison_min, saison_max, est_poule):
+    cle = ('matchs', version, int(saison_min), int(saison_max), est_poule)
+    return cache_rankings.obtenir(
+        cle, lambda: classement_matchs(charger_cube(version), saison_min, saison_max, est_poule)
+    )
+
+
+def rankings_complets(version, saison_min, saison_max):
+    cle = ('rankings', version, int(saison_min), int(saison_max), None)
+    return cache_rankings.obtenir(
+        cle, lambda: stats_rankings(charger_cube(version), saison_min, saison_max)
+    )
+
+
+def rangs_rankings(version, saison_min, saison_max):
+    # Matrice tireur x métrique de la page Rankings (toutes décroissantes),
+    # lignes dans le même ordre que rankings_complets()
+    cle = ('rangs', version, int(saison_min), int(saison_max), None)
+
+    def calcul():
+        df_stats = rankings_complets(version, saison_min, saison_max).set_index('Tireur')
+        return matrice_rangs(df_stats, {col: False for col in df_stats.columns})
+
+    return cache_rankings.obtenir(cle, calcul)
+
+
+# ===== CACHE DES ÉVOLUTIONS PAR SAISON =====
+# Séries saison x phase d'un tireur (page Matchs), lues dans le cube des
+# saisons et gardées par (tireur, plage de saisons).
+cache_evolutions = CacheLRU(taille_max=128)
+
+
+def evolution_tireur(version, tireur, saison_min, saison_max):
+    cle = (version, tireur, int(saison_min), int(saison_max))
+    return cache_evolutions.obtenir(
+        cle, lambda: evolution_saisons(charger_cube(version), tireur, saison_min, saison_max)
+    )
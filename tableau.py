@@ -0,0 +1,182 @@
+from html import escape
+
+from cache_lru import CacheLRU
+from donnees import charger_donnees, charger_index_competitions
+
+# ===== TABLEAU D'ÉLIMINATION =====
+# Disposition calculée pour un tableau de 2 à 256 places. Dans un tour de n
+# places, le match m oppose la place m (Tireur 1) à la place n+1-m
+# (Tireur 2), et le vainqueur prend la place m du tour suivant.
+# Une place sans match au premier tour est une exemption.
+
+# Tours dans l'ordre du tableau, avec leur nombre de places
+TOURS = {
+    'Tableau de 256': 256,
+    'Tableau de 128': 128,
+    'Tableau de 64': 64,
+    'Tableau de 32': 32,
+    'Tableau de 16': 16,
+    'Quart de finale': 8,
+    'Demi finale': 4,
+    'Finale': 2
+}
+
+# Couleur de chaque quart du tableau, de haut en bas
+COULEURS_QUARTS = ['blue', 'yellow', 'green', 'red']
+
+STYLE = """
+body { font-family: Arial, sans-serif; margin: 0; padding: 10px; }
+table { border-collapse: collapse; }
+td { padding: 8px; border: 1px solid #ddd; min-height: 25px; min-width: 150px; white-space: nowrap; }
+th { background-color: #f0f0f0; padding: 10px; text-align: center; font-weight: bold; border: 1px solid #ddd; }
+.blue { background-color: #3498db; color: white; }
+.yellow { background-color: #f39c12; color: white; }
+.green { background-color: #2ecc71; color: white; }
+.red { background-color: #e74c3c; color: white; }
+.transparent { background-color: transparent; }
+.vide { border: none; }
+.score { text-align: center; font-weight: bold; }
+"""
+
+
+def ordre_places(nb_places):
+    # Places de haut en bas : chaque place p d'un tableau de n est
+    # remplacée par la paire (p, 2n+1-p), retournée une fois sur deux,
+    # ce qui donne 1, 16, 9, 8, 5, 12, 13, 4, 3, 14, 11, 6, 7, 10, 15, 2 pour 16
+    ordre = [1, 2]
+    while len(ordre) < nb_places:
+        taille = 2 * len(ordre)
+        suivant = []
+        for i, place in enumerate(ordre):
+            oppose = taille + 1 - place
+            suivant += [place, oppose] if i % 2 == 0 else [oppose, place]
+        ordre = suivant
+    return ordre[:nb_places]
+
+
+def disposition(nb_places):
+    # Pour chaque tour, les matchs de haut en bas :
+    # (ligne du score, numéro de match, place du haut, place du bas).
+    # Au premier tour un match occupe 3 lignes suivies d'une ligne vide ;
+    # ensuite chaque match est centré entre les deux matchs qui l'alimentent.
+    ordre = ordre_places(nb_places)
+    centres = [4 * k + 1 for k in range(nb_places // 2)]
+    tours = []
+    while len(ordre) >= 2:
+        tours.append([
+            (centres[k], min(ordre[2 * k], ordre[2 * k + 1]), ordre[2 * k], ordre[2 * k + 1])
+            for k in range(len(centres))
+        ])
+        ordre = [min(ordre[i], ordre[i + 1]) for i in range(0, len(ordre), 2)]
+        centres = [(centres[i] + centres[i + 1]) // 2 for i in range(0, len(centres) - 1, 2)]
+    return tours
+
+
+def tours_du_tableau(tours_presents):
+    # Du plus grand tour présent jusqu'à la finale, y compris les tours sans match
+    tours = [t for t in TOURS if t in set(tours_presents)]
+    if not tours:
+        return []
+    noms = list(TOURS)
+    return noms[noms.index(tours[0]):]
+
+
+def nb_lignes(nb_places):
+    return 2 * nb_places - 1
+
+
+def matchs_du_tableau(df_tableau):
+    # {tour: {num match: (tireur 1, tireur 2, touches 1, touches 2)}} en un parcours des colonnes
+    matchs_par_tour = {}
+    for tour, num, tireur1, tireur2, touches1, touches2 in zip(
+        df_tableau['Poule / Tableau'], df_tableau['Num Match'],
+        df_tableau['Tireur 1'], df_tableau['Tireur 2'],
+        df_tableau['Touches Tireur 1'], df_tableau['Touches Tireur 2']
+    ):
+        matchs_par_tour.setdefault(tour, {})[int(num)] = (tireur1, tireur2, int(touches1), int(touches2))
+    return matchs_par_tour
+
+
+def _cellules_tableau(matchs_par_tour, tours):
+    # {(ligne, colonne): <td>} pour les cellules non vides
+    nb_places = TOURS[tours[0]]
+    lignes = nb_lignes(nb_places)
+    cellules = {}
+
+    for colonne, (tour, matchs_tour) in enumerate(zip(tours, disposition(nb_places))):
+        matchs = matchs_par_tour.get(tour, {})
+        matchs_suivants = matchs_par_tour.get(tours[colonne + 1], {}) if colonne + 1 < len(tours) else {}
+        places_suivantes = len(matchs_tour)
+        premier_tour = colonne == 0
+
+        for centre, num_match, haut, bas in matchs_tour:
+            couleur = COULEURS_QUARTS[(centre - 1) * 4 // lignes]
+            match = matchs.get(num_match)
+
+            if match is not None:
+                noms = {num_match: match[0], TOURS[tour] + 1 - num_match: match[1]}
+                # Score dans l'ordre d'affichage (haut - bas)
+                touches_haut, touches_bas = (match[2], match[3]) if haut == num_match else (match[3], match[2])
+                score = f"<td class='{couleur} score'>{touches_haut} - {touches_bas}</td>"
+            else:
+                # Exemption : le tireur de la place num_match se retrouve au tour suivant
+                noms = {}
+                num_suivant = min(num_match, places_suivantes + 1 - num_match)
+                match_suivant = matchs_suivants.get(num_suivant)
+                if premier_tour and match_suivant is not None:
+                    noms[num_match] = match_suivant[0] if num_suivant == num_match else match_suivant[1]
+                    score = "<td class='transparent score'>exempt</td>"
+                else:
+                    score = "<td class='transparent score'>-</td>"
+
+            for ligne, place in ((centre - 1, haut), (centre + 1, bas)):
+                nom = noms.get(place)
+                etiquette = f"{place} - " if premier_tour else ""
+                if nom is not None:
+                    cellules[ligne, colonne] = f"<td class='{couleur}'>{etiquette}{escape(str(nom))}</td>"
+                else:
+                    cellules[ligne, colonne] = f"<td class='transparent'>{etiquette}</td>"
+            cellules[centre, colonne] = score
+
+    return cellules
+
+
+def html_tableau(matchs_par_tour, tours):
+    # tours : colonnes à afficher, du premier tour à la finale.
+    # Le document est écrit ligne par ligne dans un tampon, joint une seule fois.
+    cellules = _cellules_tableau(matchs_par_tour, tours)
+    vide = "<td class='transparent vide'></td>"
+
+    tampon = [f"<!DOCTYPE html><html><head><style>{STYLE}</style></head><body><table><tr>"]
+    tampon.extend(f"<th>{tour}</th>" for tour in tours)
+    tampon.append("</tr>")
+    for ligne in range(nb_lignes(TOURS[tours[0]])):
+        tampon.append("<tr>")
+        tampon.extend(cellules.get((ligne, colonne), vide) for colonne in range(len(tours)))
+        tampon.append("</tr>")
+    tampon.append("</table></body></html>")
+    return "".join(tampon)
+
+
+# ===== CACHE DES TABLEAUX =====
+# Le HTML d'un tableau ne dépend que de la version des données et de la
+# compétition : un tableau déjà consulté est servi depuis la mémoire.
+cache_tableaux = CacheLRU(taille_max=128)
+
+
+def _construire_tableau(version, saison, competition, categorie):
+    entree = charger_index_competitions(version).entree(saison, competition, categorie)
+    tours = tours_du_tableau(entree.tours) if entree is not None else []
+    if not tours:
+        return None
+
+    df_tableau = charger_donnees(version)[0].iloc[entree.lignes_tableau]
+    html = html_tableau(matchs_du_tableau(df_tableau), tours)
+    hauteur = min(1200, 40 * nb_lignes(TOURS[tours[0]]) + 80)
+    return html, hauteur
+
+
+def tableau_competition(version, saison, competition, categorie):
+    # (html, hauteur d'affichage), ou None si la compétition n'a pas de tableau
+    cle = (version, int(saison), competition, categorie)
+    return cache_tableaux.obtenir(cle, lambda: _construire_tableau(version, saison, competition, categorie))